@@ -12,7 +12,16 @@ import time
 import random
 import sys
 import re
+import shlex
+import xml.etree.ElementTree as ET
 import json
+import os
+import sqlite3
+import atexit
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 # CDP 관련 (선택적)
 try:
@@ -23,15 +32,31 @@ except ImportError:
     CDP_AVAILABLE = False
 
 from config import (
-    PHONES, ADB_CONFIG, NAVER_CONFIG,
+    PHONES, PHONES_BY_NAME, ADB_CONFIG, NAVER_CONFIG,
     SCROLL_CONFIG, TOUCH_CONFIG, TYPING_CONFIG, WAIT_CONFIG,
-    COORDINATES, SELECTORS, READING_PAUSE_CONFIG, KEYBOARD_LAYOUT,
-    CDP_CONFIG, DEBUG_CONFIG
+    COORDINATES, SELECTORS, READING_PAUSE_CONFIG, KEYBOARD_LAYOUT, KEYBOARD_LAYOUT_SIZE,
+    CDP_CONFIG, DEBUG_CONFIG, RETRY_CONFIG, SEARCH_CONFIG
 )
 
 
+# 상세 로그 여부 (반복 루프 안의 로그는 이 값으로 감싸서 문자열 생성 자체를 생략)
+VERBOSE = DEBUG_CONFIG.get("verbose", True)
+
+
+# 스레드별 로그 머리말 (여러 폰 동시 실행 시 폰 이름)
+_log_context = threading.local()
+
+
 def log(message, level="INFO"):
-    print(f"[{level}] {message}")
+    prefix = getattr(_log_context, "prefix", "")
+    print(f"[{level}] {prefix}{message}")
+
+
+def log_lines(lines, level="INFO"):
+    """여러 줄 로그를 한 번에 출력 (줄마다 print 호출하지 않음)"""
+    if lines:
+        prefix = getattr(_log_context, "prefix", "")
+        sys.stdout.write("".join(f"[{level}] {prefix}{line}\n" for line in lines))
 
 
 def random_delay(min_sec, max_sec):
@@ -40,6 +65,314 @@ def random_delay(min_sec, max_sec):
     return delay
 
 
+def backoff_delay(attempt, max_delay=None):
+    """재시도 대기 (지수 백오프 + 지터)
+
+    Args:
+        attempt: 0부터 시작하는 재시도 순번
+        max_delay: 대기 상한 (초, 전체 마감까지 남은 시간 등)
+
+    Returns:
+        float: 실제 대기한 시간 (초)
+    """
+    base = RETRY_CONFIG["retry_base"]
+    cap = RETRY_CONFIG["retry_cap"]
+    delay = min(cap, base * (2 ** attempt)) + random.uniform(0, RETRY_CONFIG["retry_jitter"])
+    if max_delay is not None:
+        delay = max(0, min(delay, max_delay))
+    time.sleep(delay)
+    return delay
+
+
+# ============================================
+# 화면 XML 정규식 (모듈 로드 시 / 값별로 한 번만 컴파일)
+# ============================================
+# uiautomator bounds="[x1,y1][x2,y2]"
+BOUNDS_RE = re.compile(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]')
+
+# 로딩 확인용 표시 (여러 단어를 한 번의 스캔으로, xml.lower() 복사 없이)
+NAVER_LOADED_RE = re.compile(r'naver|MM_SEARCH|검색', re.IGNORECASE)
+SEARCH_LOADED_RE = re.compile(r'search|검색', re.IGNORECASE)
+
+# 검색 버튼 (키보드 검색키 없을 때 대체용)
+SEARCH_BUTTON_RES = [
+    re.compile(r'<node[^>]+content-desc="[^"]*검색[^"]*"[^>]+bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"', re.IGNORECASE),
+    re.compile(r'<node[^>]+resource-id="[^"]*search[^"]*btn[^"]*"[^>]+bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"', re.IGNORECASE),
+]
+
+
+# 노드 속성 (name="value") - 순서 상관없이 dict로
+ATTR_RE = re.compile(r'([\w:-]+)="([^"]*)"')
+
+
+@lru_cache(maxsize=64)
+def resource_id_node_re(resource_id):
+    """resource-id에 값이 들어있는 노드 태그 하나 (속성 순서 무관, 교대(|) 패턴 없음)"""
+    return re.compile(rf'<node\b[^>]*? resource-id="[^"]*{re.escape(resource_id)}[^"]*"[^>]*>')
+
+
+@lru_cache(maxsize=64)
+def text_node_re(text, partial):
+    """text가 일치(partial이면 포함)하는 노드 태그 하나"""
+    value = rf'[^"]*{re.escape(text)}[^"]*' if partial else re.escape(text)
+    return re.compile(rf'<node\b[^>]*? text="{value}"[^>]*>')
+
+
+def node_attrs(node_tag):
+    """노드 태그 문자열 → 속성 dict"""
+    return dict(ATTR_RE.findall(node_tag))
+
+
+@lru_cache(maxsize=32)
+def domain_patterns(base_domain):
+    """도메인 검색 패턴 (존재 여부 확인용, 노드 정규식 대체용)"""
+    domain = re.escape(base_domain)
+    return (
+        re.compile(domain, re.IGNORECASE),
+        re.compile(rf'<node[^>]+(?:text|content-desc)="([^"]*{domain}[^"]*)"[^>]+bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"[^>]*/>', re.IGNORECASE),
+    )
+
+
+# 클릭 좌표 전용 난수 (randint → randrange 래퍼 한 단계 생략)
+_click_rng = random.Random()
+_randrange = _click_rng.randrange
+
+
+@lru_cache(maxsize=256)
+def click_box(bounds):
+    """요소 안쪽 클릭 범위 (가장자리 15% 제외, 같은 bounds 재클릭 시 재계산 안 함)
+
+    Returns:
+        tuple: (x_lo, x_hi, y_lo, y_hi) - randint 범위 그대로 사용
+    """
+    x1, y1, x2, y2 = bounds
+    margin_x = max(2, int((x2 - x1) * 0.15))
+    margin_y = max(2, int((y2 - y1) * 0.15))
+    x_lo = x1 + margin_x
+    y_lo = y1 + margin_y
+    return x_lo, max(x_lo, x2 - margin_x), y_lo, max(y_lo, y2 - margin_y)
+
+
+# ============================================
+# 한글 자모 분리 테이블
+# ============================================
+CHOSUNG = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+JUNGSUNG = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ']
+JONGSUNG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 키보드에 없는 겹모음/겹받침 → 키 두 번
+COMPLEX_VOWEL = {
+    'ㅘ': ['ㅗ', 'ㅏ'], 'ㅙ': ['ㅗ', 'ㅐ'], 'ㅚ': ['ㅗ', 'ㅣ'],
+    'ㅝ': ['ㅜ', 'ㅓ'], 'ㅞ': ['ㅜ', 'ㅔ'], 'ㅟ': ['ㅜ', 'ㅣ'],
+    'ㅢ': ['ㅡ', 'ㅣ'], 'ㅒ': ['ㅑ', 'ㅣ'], 'ㅖ': ['ㅕ', 'ㅣ'],
+}
+
+COMPLEX_JONG = {
+    'ㄳ': ['ㄱ', 'ㅅ'], 'ㄵ': ['ㄴ', 'ㅈ'], 'ㄶ': ['ㄴ', 'ㅎ'],
+    'ㄺ': ['ㄹ', 'ㄱ'], 'ㄻ': ['ㄹ', 'ㅁ'], 'ㄼ': ['ㄹ', 'ㅂ'],
+    'ㄽ': ['ㄹ', 'ㅅ'], 'ㄾ': ['ㄹ', 'ㅌ'], 'ㄿ': ['ㄹ', 'ㅍ'],
+    'ㅀ': ['ㄹ', 'ㅎ'], 'ㅄ': ['ㅂ', 'ㅅ'],
+}
+
+
+@lru_cache(maxsize=4096)
+def decompose_syllable(char):
+    """완성형 한글 한 글자 → 입력할 자모 순서 (같은 글자는 캐시)
+
+    Returns:
+        tuple: 자모 (겹모음/겹받침은 두 키로 풀어서)
+    """
+    code = ord(char) - 0xAC00
+    cho = code // 588
+    jung = (code % 588) // 28
+    jong = code % 28
+
+    jamos = [CHOSUNG[cho]]
+
+    vowel = JUNGSUNG[jung]
+    jamos.extend(COMPLEX_VOWEL.get(vowel, [vowel]))
+
+    if jong > 0:
+        jongchar = JONGSUNG[jong]
+        jamos.extend(COMPLEX_JONG.get(jongchar, [jongchar]))
+
+    return tuple(jamos)
+
+
+def poll_until(check, max_polls):
+    """check()가 참을 돌려줄 때까지 폴링 (간격은 element_check_interval부터 2배씩, 최대 element_check_interval_max)
+
+    Args:
+        check: 확인 함수 (찾으면 참인 값 반환)
+        max_polls: 최대 확인 횟수
+
+    Returns:
+        check()가 돌려준 참인 값 (끝까지 못 찾으면 None)
+    """
+    interval = WAIT_CONFIG["element_check_interval"]
+    max_interval = WAIT_CONFIG.get("element_check_interval_max", 0.5)
+    for poll in range(max_polls):
+        result = check()
+        if result:
+            return result
+        if poll < max_polls - 1:
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+    return None
+
+
+def draw_scroll_delays(count, min_sec=0.1, max_sec=0.2):
+    """연속 스크롤 사이 대기시간을 한 번에 미리 뽑기 (읽기 멈춤 포함)
+
+    Returns:
+        list: [(대기시간, 읽기멈춤 여부), ...] - count개
+    """
+    uniform = random.uniform
+    rand = random.random
+    pause_enabled = READING_PAUSE_CONFIG["enabled"]
+    probability = READING_PAUSE_CONFIG["probability"]
+    pause_min = READING_PAUSE_CONFIG["min_time"]
+    pause_max = READING_PAUSE_CONFIG["max_time"]
+
+    delays = []
+    for _ in range(count):
+        if pause_enabled and rand() < probability:
+            delays.append((uniform(pause_min, pause_max), True))
+        else:
+            delays.append((uniform(min_sec, max_sec), False))
+    return delays
+
+
+# ============================================
+# CDP 요소 검색 JS (값별로 한 번만 생성)
+# ============================================
+@lru_cache(maxsize=32)
+def element_info_js(text, exact_match=False):
+    """CDPCalculator.get_element_info용 JS (같은 텍스트는 한 번만 생성)"""
+    match_condition = f"txt === '{text}'" if exact_match else f"txt.includes('{text}') && txt.length < 50"
+
+    js = f"""
+    (function() {{
+        const elements = [...document.querySelectorAll('*')];
+        for (const el of elements) {{
+            const txt = el.textContent.trim();
+            if ({match_condition}) {{
+                const rect = el.getBoundingClientRect();
+                if (rect.height > 0 && rect.height < 150 && rect.width > 50) {{
+                    // 클릭 가능한 요소인지 확인
+                    const isClickable = el.tagName === 'A' || el.tagName === 'BUTTON' ||
+                                      el.onclick !== null ||
+                                      window.getComputedStyle(el).cursor === 'pointer';
+
+                    return {{
+                        found: true,
+                        y: rect.top + window.scrollY,
+                        screenY: rect.top,
+                        height: rect.height,
+                        width: rect.width,
+                        centerX: rect.left + rect.width / 2,
+                        centerY: rect.top + rect.height / 2,
+                        clickable: isClickable,
+                        elementType: el.tagName,
+                        text: txt.substring(0, 50)
+                    }};
+                }}
+            }}
+        }}
+        return {{ found: false }};
+    }})()
+    """
+    return js
+
+
+@lru_cache(maxsize=32)
+def domain_info_js(domain):
+    """CDPCalculator.get_domain_info용 JS (같은 도메인은 한 번만 생성 - 페이지마다 재사용)"""
+    # 경로 포함 여부 확인
+    has_path = '/' in domain and not domain.endswith('/')
+    base_domain = domain.split('/')[0]
+
+    js = f"""
+    (function() {{
+        const targetDomain = "{domain}";
+        const baseDomain = "{base_domain}";
+        const hasPath = {"true" if has_path else "false"};
+        const debugLogs = [];
+
+        // 베이스 도메인이 포함된 모든 링크 찾기
+        const allLinks = document.querySelectorAll('a[href*="' + baseDomain + '"]');
+        debugLogs.push('[CDP] 총 ' + allLinks.length + '개 링크 발견 (base: ' + baseDomain + ')');
+
+        for (const link of allLinks) {{
+            const href = link.getAttribute('href');
+            if (!href) continue;
+
+            // sublink 제외 (서브링크는 위치 겹침 문제)
+            const heatmapTarget = link.getAttribute('data-heatmap-target');
+            if (heatmapTarget === '.sublink') {{
+                debugLogs.push('[CDP] 제외(sublink): ' + href.substring(0, 60));
+                continue;
+            }}
+
+            // 정확한 매칭 체크
+            let isMatch = false;
+            if (hasPath) {{
+                // 경로가 지정된 경우: 정확한 경로 매칭
+                if (href.endsWith(targetDomain) || href.endsWith(targetDomain + '/')) {{
+                    isMatch = true;
+                }}
+            }} else {{
+                // 경로가 없는 경우: 메인 도메인만 (서브링크 제외)
+                if (href.endsWith(targetDomain + '/') || href.endsWith(targetDomain)) {{
+                    isMatch = true;
+                }}
+            }}
+
+            if (!isMatch) {{
+                debugLogs.push('[CDP] 제외(경로불일치): ' + href.substring(0, 60));
+                continue;
+            }}
+
+            // 웹사이트 영역 체크 (type-web 클래스 확인)
+            let isWebArea = false;
+            let parent = link.parentElement;
+            while (parent) {{
+                if (parent.classList && parent.classList.contains('type-web')) {{
+                    isWebArea = true;
+                    break;
+                }}
+                if (parent.getAttribute && parent.getAttribute('data-sds-comp') === 'Profile') {{
+                    isWebArea = true;
+                    break;
+                }}
+                parent = parent.parentElement;
+            }}
+
+            const rect = link.getBoundingClientRect();
+            if (rect.height > 0 && rect.width > 50) {{
+                debugLogs.push('[CDP] ✓ 매칭! href=' + href.substring(0, 60) + ' Y=' + (rect.top + window.scrollY).toFixed(0));
+                return {{
+                    found: true,
+                    y: rect.top + window.scrollY,
+                    screenY: rect.top,
+                    height: rect.height,
+                    width: rect.width,
+                    centerX: rect.left + rect.width / 2,
+                    centerY: rect.top + rect.height / 2,
+                    href: link.href,
+                    text: link.textContent.trim().substring(0, 50),
+                    isWebArea: isWebArea,
+                    debugLogs: debugLogs
+                }};
+            }}
+        }}
+
+        return {{ found: false, debugLogs: debugLogs }};
+    }})()
+    """
+    return js
+
+
 # ============================================
 # CDP 스크롤 계산기 (정확도 향상 버전)
 # ============================================
@@ -53,10 +386,25 @@ class CDPCalculator:
         self.connected = False
         self.debug = DEBUG_CONFIG.get("cdp_debug", False)
 
+        # 설정값 (실행 중 바뀌지 않으므로 한 번만 읽음)
+        self.status_bar_height = CDP_CONFIG.get("status_bar_height", 50)
+        self.address_bar_height = CDP_CONFIG.get("address_bar_height", 56)
+        self.nav_bar_height = CDP_CONFIG.get("nav_bar_height", 0)
+        self.page_load_wait = CDP_CONFIG.get("page_load_wait", 3.0)
+        self.after_scroll_wait = CDP_CONFIG.get("after_scroll_wait", 0.3)
+        self.scroll_calibration = CDP_CONFIG.get("scroll_calibration", 0.85)
+        self.margin_ratio = CDP_CONFIG.get("margin_scroll_ratio", 0.1)
+        self.margin_min = CDP_CONFIG.get("margin_scroll_min", 1)
+        self.margin_max = CDP_CONFIG.get("margin_scroll_max", 5)
+        self.more_target_position = CDP_CONFIG.get("more_target_position", 0.4)
+        self.domain_target_position = CDP_CONFIG.get("domain_target_position", 0.35)
+
         # 뷰포트 정보 (계산 후 저장)
         self.screen_width = 0
         self.screen_height = 0
         self.effective_viewport_height = 0  # 실제 스크롤 가능 영역
+        self._applied_viewport = None  # 이 연결에 이미 적용한 (가로, 세로)
+        self._page_metrics = {}  # 현재 페이지 JS 측정값 (페이지 이동 시 초기화)
 
     def _debug_log(self, message):
         """디버그 로그"""
@@ -85,6 +433,7 @@ class CDPCalculator:
 
             self.ws = websocket.create_connection(ws_url, timeout=5)
             self.connected = True
+            self._applied_viewport = None  # 새 연결엔 에뮬레이션 다시 적용
             log("[CDP] 연결 성공!")
             return True
 
@@ -102,12 +451,17 @@ class CDPCalculator:
         msg = {"id": self.msg_id, "method": method}
         if params:
             msg["params"] = params
-        self.ws.send(json.dumps(msg))
 
-        while True:
-            response = json.loads(self.ws.recv())
-            if response.get("id") == self.msg_id:
-                return response.get("result", {})
+        try:
+            self.ws.send(json.dumps(msg))
+            while True:
+                response = json.loads(self.ws.recv())
+                if response.get("id") == self.msg_id:
+                    return response.get("result", {})
+        except (websocket.WebSocketException, OSError):
+            # 연결 끊김 → 다음 사용 시 재연결하도록 표시
+            self.connected = False
+            raise
 
     def set_viewport(self, screen_width, screen_height):
         """뷰포트 크기 설정 (실제 모바일 브라우저 환경 반영)"""
@@ -115,9 +469,9 @@ class CDPCalculator:
         self.screen_height = screen_height
 
         # 실제 뷰포트 계산 (상태바, 주소창 제외)
-        status_bar = CDP_CONFIG.get("status_bar_height", 50)
-        address_bar = CDP_CONFIG.get("address_bar_height", 56)
-        nav_bar = CDP_CONFIG.get("nav_bar_height", 0)
+        status_bar = self.status_bar_height
+        address_bar = self.address_bar_height
+        nav_bar = self.nav_bar_height
 
         # 실제 브라우저 뷰포트 높이
         self.effective_viewport_height = screen_height - status_bar - address_bar - nav_bar
@@ -126,8 +480,13 @@ class CDPCalculator:
         self._debug_log(f"상태바: {status_bar}, 주소창: {address_bar}, 네비바: {nav_bar}")
         self._debug_log(f"실제 뷰포트: {self.effective_viewport_height}px")
 
-        # Page, Network 도메인 활성화
+        # 같은 연결에 같은 크기면 에뮬레이션 재전송 생략
+        if self._applied_viewport == (screen_width, screen_height):
+            return
+
+        # Page, Network 도메인 활성화 (lifecycle 이벤트는 navigate 완료 판정용)
         self.send("Page.enable", {})
+        self.send("Page.setLifecycleEventsEnabled", {"enabled": True})
         self.send("Network.enable", {})
 
         # UA 모바일로 설정
@@ -147,13 +506,59 @@ class CDPCalculator:
             "screenHeight": screen_height
         })
 
+        self._applied_viewport = (screen_width, screen_height)
+        self._page_metrics = {}
         log(f"[CDP] 뷰포트 설정: {screen_width}x{self.effective_viewport_height} (실제 브라우저 영역)")
 
     def navigate(self, url):
-        """페이지 이동"""
-        wait_time = CDP_CONFIG.get("page_load_wait", 3.0)
-        self.send("Page.navigate", {"url": url})
-        time.sleep(wait_time)
+        """페이지 이동 (load 이벤트 오면 바로 진행, 최대 page_load_wait초)"""
+        self._page_metrics = {}
+        start = time.time()
+        nav = self.send("Page.navigate", {"url": url})
+        if nav.get("errorText"):
+            log(f"[CDP] 페이지 이동 실패: {nav['errorText']}")
+
+        if self._wait_for_load_event(nav.get("frameId"), nav.get("loaderId"), self.page_load_wait):
+            self._debug_log(f"로딩 완료: {time.time() - start:.2f}초")
+        else:
+            self._debug_log(f"load 이벤트 없음, {self.page_load_wait}초 대기 후 진행")
+
+    def _wait_for_load_event(self, frame_id, loader_id, timeout):
+        """이번 navigate의 load lifecycle 이벤트 대기 (Page.enable은 set_viewport에서 켬)
+
+        연결을 계속 쓰기 때문에 소켓에 이전 이동(타임아웃 난 것)이나 새로고침의
+        load 이벤트가 남아 있을 수 있음 → Page.navigate가 준 frameId/loaderId가
+        같은 이벤트만 인정
+
+        Returns:
+            bool: 시간 내 이벤트 수신 여부
+        """
+        if not loader_id:
+            # 같은 문서 안 이동(#해시 등)은 새 로더가 없음 → 기다릴 load 없음
+            return True
+
+        deadline = time.time() + timeout
+        try:
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self.ws.settimeout(remaining)
+                message = json.loads(self.ws.recv())
+                if message.get("method") != "Page.lifecycleEvent":
+                    continue
+                params = message.get("params", {})
+                if (params.get("name") == "load" and params.get("frameId") == frame_id
+                        and params.get("loaderId") == loader_id):
+                    return True
+        except websocket.WebSocketTimeoutException:
+            return False
+        except (websocket.WebSocketException, OSError):
+            self.connected = False
+            raise
+        finally:
+            if self.connected:
+                self.ws.settimeout(5)
 
     def evaluate(self, expression):
         """JS 실행"""
@@ -163,13 +568,19 @@ class CDPCalculator:
         })
         return result.get("result", {}).get("value")
 
+    def _page_metric(self, name, expression):
+        """페이지 단위 측정값 (같은 페이지에선 한 번만 JS 실행)"""
+        if name not in self._page_metrics:
+            self._page_metrics[name] = self.evaluate(expression) or 0
+        return self._page_metrics[name]
+
     def get_viewport_height(self):
         """실제 뷰포트 높이 (JS에서)"""
-        return self.evaluate("window.innerHeight") or 0
+        return self._page_metric("viewport_height", "window.innerHeight")
 
     def get_scroll_height(self):
         """전체 문서 높이"""
-        return self.evaluate("document.documentElement.scrollHeight") or 0
+        return self._page_metric("scroll_height", "document.documentElement.scrollHeight")
 
     def get_scroll_position(self):
         """현재 스크롤 위치"""
@@ -181,39 +592,7 @@ class CDPCalculator:
         Returns:
             dict: {found, y, screenY, height, clickable, elementType}
         """
-        match_condition = f"txt === '{text}'" if exact_match else f"txt.includes('{text}') && txt.length < 50"
-
-        js = f"""
-        (function() {{
-            const elements = [...document.querySelectorAll('*')];
-            for (const el of elements) {{
-                const txt = el.textContent.trim();
-                if ({match_condition}) {{
-                    const rect = el.getBoundingClientRect();
-                    if (rect.height > 0 && rect.height < 150 && rect.width > 50) {{
-                        // 클릭 가능한 요소인지 확인
-                        const isClickable = el.tagName === 'A' || el.tagName === 'BUTTON' ||
-                                          el.onclick !== null ||
-                                          window.getComputedStyle(el).cursor === 'pointer';
-
-                        return {{
-                            found: true,
-                            y: rect.top + window.scrollY,
-                            screenY: rect.top,
-                            height: rect.height,
-                            width: rect.width,
-                            centerX: rect.left + rect.width / 2,
-                            centerY: rect.top + rect.height / 2,
-                            clickable: isClickable,
-                            elementType: el.tagName,
-                            text: txt.substring(0, 50)
-                        }};
-                    }}
-                }}
-            }}
-            return {{ found: false }};
-        }})()
-        """
+        js = element_info_js(text, exact_match)
         result = self.evaluate(js)
         if result and result.get("found"):
             self._debug_log(f"요소 발견: '{result.get('text', '')[:30]}' Y={result['y']:.0f}")
@@ -229,93 +608,11 @@ class CDPCalculator:
         Returns:
             dict: {found, y, screenY, height, href, text}
         """
-        # 경로 포함 여부 확인
-        has_path = '/' in domain and not domain.endswith('/')
-        base_domain = domain.split('/')[0]
-
-        js = f"""
-        (function() {{
-            const targetDomain = "{domain}";
-            const baseDomain = "{base_domain}";
-            const hasPath = {"true" if has_path else "false"};
-            const debugLogs = [];
-
-            // 베이스 도메인이 포함된 모든 링크 찾기
-            const allLinks = document.querySelectorAll('a[href*="' + baseDomain + '"]');
-            debugLogs.push('[CDP] 총 ' + allLinks.length + '개 링크 발견 (base: ' + baseDomain + ')');
-
-            for (const link of allLinks) {{
-                const href = link.getAttribute('href');
-                if (!href) continue;
-
-                // sublink 제외 (서브링크는 위치 겹침 문제)
-                const heatmapTarget = link.getAttribute('data-heatmap-target');
-                if (heatmapTarget === '.sublink') {{
-                    debugLogs.push('[CDP] 제외(sublink): ' + href.substring(0, 60));
-                    continue;
-                }}
-
-                // 정확한 매칭 체크
-                let isMatch = false;
-                if (hasPath) {{
-                    // 경로가 지정된 경우: 정확한 경로 매칭
-                    if (href.endsWith(targetDomain) || href.endsWith(targetDomain + '/')) {{
-                        isMatch = true;
-                    }}
-                }} else {{
-                    // 경로가 없는 경우: 메인 도메인만 (서브링크 제외)
-                    if (href.endsWith(targetDomain + '/') || href.endsWith(targetDomain)) {{
-                        isMatch = true;
-                    }}
-                }}
-
-                if (!isMatch) {{
-                    debugLogs.push('[CDP] 제외(경로불일치): ' + href.substring(0, 60));
-                    continue;
-                }}
-
-                // 웹사이트 영역 체크 (type-web 클래스 확인)
-                let isWebArea = false;
-                let parent = link.parentElement;
-                while (parent) {{
-                    if (parent.classList && parent.classList.contains('type-web')) {{
-                        isWebArea = true;
-                        break;
-                    }}
-                    if (parent.getAttribute && parent.getAttribute('data-sds-comp') === 'Profile') {{
-                        isWebArea = true;
-                        break;
-                    }}
-                    parent = parent.parentElement;
-                }}
-
-                const rect = link.getBoundingClientRect();
-                if (rect.height > 0 && rect.width > 50) {{
-                    debugLogs.push('[CDP] ✓ 매칭! href=' + href.substring(0, 60) + ' Y=' + (rect.top + window.scrollY).toFixed(0));
-                    return {{
-                        found: true,
-                        y: rect.top + window.scrollY,
-                        screenY: rect.top,
-                        height: rect.height,
-                        width: rect.width,
-                        centerX: rect.left + rect.width / 2,
-                        centerY: rect.top + rect.height / 2,
-                        href: link.href,
-                        text: link.textContent.trim().substring(0, 50),
-                        isWebArea: isWebArea,
-                        debugLogs: debugLogs
-                    }};
-                }}
-            }}
-
-            return {{ found: false, debugLogs: debugLogs }};
-        }})()
-        """
+        js = domain_info_js(domain)
         result = self.evaluate(js)
-        # 디버그 로그 출력
-        if result and result.get("debugLogs"):
-            for debug_log in result["debugLogs"]:
-                log(debug_log)
+        # 디버그 로그 출력 (cdp_debug 모드에서만)
+        if self.debug and result and result.get("debugLogs"):
+            log_lines(result["debugLogs"])
         if result and result.get("found"):
             log(f"[CDP] 도메인 발견: '{result.get('text', '')[:30]}' href={result.get('href', '')[:50]}")
         else:
@@ -325,7 +622,7 @@ class CDPCalculator:
     def scroll_to(self, y):
         """스크롤 이동"""
         self.evaluate(f"window.scrollTo(0, {y})")
-        time.sleep(CDP_CONFIG.get("after_scroll_wait", 0.3))
+        time.sleep(self.after_scroll_wait)
 
     def click(self, x, y):
         """터치 클릭"""
@@ -357,7 +654,7 @@ class CDPCalculator:
         scroll_needed = element_y - target_screen_y
 
         # 스크롤 보정 계수 적용
-        calibration = CDP_CONFIG.get("scroll_calibration", 0.85)
+        calibration = self.scroll_calibration
         effective_scroll = scroll_distance * calibration
 
         # 스크롤 횟수 계산
@@ -367,20 +664,18 @@ class CDPCalculator:
         raw_count = scroll_needed / effective_scroll
 
         # 여유 스크롤 계산 - 도메인 찾기는 여유 최소화
-        margin_ratio = CDP_CONFIG.get("margin_scroll_ratio", 0.1)
-        margin_min = CDP_CONFIG.get("margin_scroll_min", 1)
-        margin_max = CDP_CONFIG.get("margin_scroll_max", 5)
-
-        margin = int(raw_count * margin_ratio)
-        margin = max(margin_min, min(margin, margin_max))
+        margin = int(raw_count * self.margin_ratio)
+        margin = max(self.margin_min, min(margin, self.margin_max))
 
         final_count = max(0, int(raw_count) + margin)
 
         # 디버그 로그 (항상 출력)
-        log(f"[CDP-계산] 요소Y={element_y:.0f}, 뷰포트={self.effective_viewport_height}, 타겟비율={target_position}")
-        log(f"[CDP-계산] 타겟Y={target_screen_y:.0f}, 필요스크롤={scroll_needed:.0f}px")
-        log(f"[CDP-계산] 스크롤거리={scroll_distance}, 보정={calibration}, 유효거리={effective_scroll:.0f}px")
-        log(f"[CDP-계산] 기본횟수={raw_count:.1f}, 여유={margin}, 최종={final_count}회")
+        log_lines([
+            f"[CDP-계산] 요소Y={element_y:.0f}, 뷰포트={self.effective_viewport_height}, 타겟비율={target_position}",
+            f"[CDP-계산] 타겟Y={target_screen_y:.0f}, 필요스크롤={scroll_needed:.0f}px",
+            f"[CDP-계산] 스크롤거리={scroll_distance}, 보정={calibration}, 유효거리={effective_scroll:.0f}px",
+            f"[CDP-계산] 기본횟수={raw_count:.1f}, 여유={margin}, 최종={final_count}회",
+        ])
 
         return final_count
 
@@ -414,10 +709,12 @@ class CDPCalculator:
         final_count = max(0, int(raw_count))
 
         # 디버그 로그
-        log(f"[CDP-계산-도메인] 요소Y={element_y:.0f}, 뷰포트={self.effective_viewport_height}, 타겟비율={target_position}")
-        log(f"[CDP-계산-도메인] 타겟Y={target_screen_y:.0f}, 필요스크롤={scroll_needed:.0f}px")
-        log(f"[CDP-계산-도메인] 스크롤거리={scroll_distance} (보정없음)")
-        log(f"[CDP-계산-도메인] 기본횟수={raw_count:.1f}, 마진=0, 최종={final_count}회 (내림)")
+        log_lines([
+            f"[CDP-계산-도메인] 요소Y={element_y:.0f}, 뷰포트={self.effective_viewport_height}, 타겟비율={target_position}",
+            f"[CDP-계산-도메인] 타겟Y={target_screen_y:.0f}, 필요스크롤={scroll_needed:.0f}px",
+            f"[CDP-계산-도메인] 스크롤거리={scroll_distance} (보정없음)",
+            f"[CDP-계산-도메인] 기본횟수={raw_count:.1f}, 마진=0, 최종={final_count}회 (내림)",
+        ])
 
         return final_count
 
@@ -433,6 +730,8 @@ class CDPCalculator:
                 domain_page: 도메인이 있는 페이지 번호,
                 viewport_height: 실제 뷰포트 높이,
                 scroll_distance: ADB 스크롤 1회 거리,
+                more_found: "검색결과 더보기" 실측 여부 (False면 기본값 30),
+                domain_found: 도메인 실측 여부,
                 calculated: 계산 성공 여부
             }
         """
@@ -446,6 +745,8 @@ class CDPCalculator:
             "domain_page": 1,
             "viewport_height": 0,
             "scroll_distance": 0,
+            "more_found": False,
+            "domain_found": False,
             "calculated": False
         }
 
@@ -470,10 +771,11 @@ class CDPCalculator:
             log(f"[CDP] 통합 페이지 이동: {keyword}")
             self.navigate(search_url)
 
-            # CDP 뷰포트 확인
-            cdp_viewport = self.get_viewport_height()
-            doc_height = self.get_scroll_height()
-            self._debug_log(f"CDP 뷰포트: {cdp_viewport}px, 문서높이: {doc_height}px")
+            # CDP 뷰포트 확인 (디버그용이라 디버그 모드에서만 조회)
+            if self.debug:
+                cdp_viewport = self.get_viewport_height()
+                doc_height = self.get_scroll_height()
+                self._debug_log(f"CDP 뷰포트: {cdp_viewport}px, 문서높이: {doc_height}px")
 
             # "검색결과 더보기" 위치 계산
             more_info = self.get_element_info("검색결과 더보기")
@@ -481,8 +783,9 @@ class CDPCalculator:
             if more_info and more_info.get("found"):
                 more_y = more_info["y"]
                 result["more_element_y"] = more_y
+                result["more_found"] = True
 
-                target_pos = CDP_CONFIG.get("more_target_position", 0.4)
+                target_pos = self.more_target_position
                 result["more_scroll_count"] = self._calculate_scroll_count(
                     more_y, target_pos, scroll_distance
                 )
@@ -498,8 +801,8 @@ class CDPCalculator:
             log(f"[CDP] 더보기 페이지 이동...")
             self.navigate(more_page_url)
 
-            # 도메인 위치 계산 (최대 5페이지까지 탐색)
-            max_pages = 5
+            # 도메인 위치 계산 (발견 즉시 중단, 최대 max_more_pages까지 탐색)
+            max_pages = SEARCH_CONFIG.get("max_more_pages", 5)
             for page in range(1, max_pages + 1):
                 if page > 1:
                     # 다음 페이지로 이동
@@ -513,12 +816,13 @@ class CDPCalculator:
                     domain_y = domain_info["y"]
                     result["domain_element_y"] = domain_y
                     result["domain_page"] = page
+                    result["domain_found"] = True
 
                     # 디버그: 어떤 href를 찾았는지 출력
                     log(f"[CDP] 찾은 href: {domain_info.get('href', 'N/A')[:70]}")
                     log(f"[CDP] 찾은 텍스트: {domain_info.get('text', 'N/A')[:50]}")
 
-                    target_pos = CDP_CONFIG.get("domain_target_position", 0.35)
+                    target_pos = self.domain_target_position
                     # 도메인은 마진 없이 계산 (오버슈팅 방지)
                     result["domain_scroll_count"] = self._calculate_scroll_count_no_margin(
                         domain_y, target_pos, scroll_distance
@@ -547,10 +851,250 @@ class CDPCalculator:
                 self.ws.close()
             except:
                 pass
+            self.ws = None
             self.connected = False
             log("[CDP] 연결 종료")
 
 
+# ============================================
+# CDP 스크롤 계산 캐시 (디스크 저장)
+# ============================================
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _scroll_cache_path():
+    return os.path.join(SCRIPT_DIR, CDP_CONFIG.get("cache_file", ".scroll_cache.db"))
+
+
+def _scroll_settings_tag():
+    """계산에 쓰이는 설정값 묶음 (보정/타겟 위치 등을 바꾸면 다른 키 → 옛 결과 안 씀)"""
+    cdp_keys = (
+        "scroll_calibration", "more_target_position", "domain_target_position",
+        "margin_scroll_ratio", "margin_scroll_min", "margin_scroll_max",
+        "status_bar_height", "address_bar_height", "nav_bar_height",
+    )
+    values = [SCROLL_CONFIG.get("distance", 400), SEARCH_CONFIG.get("max_more_pages", 5)]
+    values += [CDP_CONFIG.get(key) for key in cdp_keys]
+    return ",".join(str(value) for value in values)
+
+
+def _scroll_cache_key(keyword, domain, screen_width, screen_height):
+    return f"{keyword}|{domain}|{screen_width}x{screen_height}|{_scroll_settings_tag()}"
+
+
+def _open_scroll_cache():
+    """캐시 DB 열기 (sqlite가 파일 잠금 → 폰별 프로세스 여러 개가 같이 써도 안전)"""
+    conn = sqlite3.connect(_scroll_cache_path(), timeout=10, isolation_level=None)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS scroll_cache ("
+        "key TEXT PRIMARY KEY, info TEXT NOT NULL, count INTEGER NOT NULL, saved_at REAL NOT NULL)"
+    )
+    return conn
+
+
+def load_cached_scroll_info(keyword, domain, screen_width, screen_height):
+    """캐시된 스크롤 정보 가져오기 (사용 횟수 1 증가)
+
+    Returns:
+        dict: cdp_info (없거나 만료/갱신 주기 도달 시 None)
+    """
+    if not CDP_CONFIG.get("cache_enabled", True):
+        return None
+
+    key = _scroll_cache_key(keyword, domain, screen_width, screen_height)
+    ttl = CDP_CONFIG.get("cache_ttl_hours", 6) * 3600
+    refresh_interval = CDP_CONFIG.get("cache_refresh_interval", 10)
+
+    try:
+        conn = _open_scroll_cache()
+        try:
+            # 읽기 → 횟수 증가를 한 트랜잭션으로 (다른 프로세스가 끼어들지 않게 쓰기 잠금 먼저)
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT info, count, saved_at FROM scroll_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                conn.execute("COMMIT")
+                return None
+
+            info, count, saved_at = row
+            if time.time() - saved_at > ttl or count >= refresh_interval:
+                log(f"[CDP 캐시] 만료 (사용 {count}회), 다시 계산")
+                conn.execute("DELETE FROM scroll_cache WHERE key = ?", (key,))
+                conn.execute("COMMIT")
+                return None
+
+            conn.execute("UPDATE scroll_cache SET count = ? WHERE key = ?", (count + 1, key))
+            conn.execute("COMMIT")
+            cdp_info = json.loads(info)
+        finally:
+            conn.close()
+    except Exception as e:
+        log(f"[CDP 캐시] 읽기 실패: {e}")
+        return None
+
+    log(f"[CDP 캐시] 사용 ({count + 1}/{refresh_interval}회): 더보기 {cdp_info['more_scroll_count']}회, 도메인 {cdp_info['domain_scroll_count']}회")
+    return cdp_info
+
+
+def save_cached_scroll_info(keyword, domain, screen_width, screen_height, cdp_info):
+    """계산 성공한 스크롤 정보 저장 (더보기/도메인 둘 다 실측한 경우만)
+
+    못 찾아서 기본값(더보기 30회)이나 -1이 들어간 결과는 페이지 로딩 실패일 수도 있어서
+    저장하지 않음 (저장하면 갱신 주기 동안 잘못된 값을 계속 씀)
+    """
+    if not CDP_CONFIG.get("cache_enabled", True) or not cdp_info.get("calculated"):
+        return
+    if not (cdp_info.get("more_found") and cdp_info.get("domain_found")):
+        log("[CDP 캐시] 실측 못 한 값 있음, 저장 안 함")
+        return
+
+    key = _scroll_cache_key(keyword, domain, screen_width, screen_height)
+    ttl = CDP_CONFIG.get("cache_ttl_hours", 6) * 3600
+    now = time.time()
+    try:
+        conn = _open_scroll_cache()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO scroll_cache (key, info, count, saved_at) VALUES (?, ?, 1, ?)",
+                (key, json.dumps(cdp_info), now)
+            )
+            # 만료된 항목 정리 (설정 변경으로 안 쓰이게 된 키 포함)
+            conn.execute("DELETE FROM scroll_cache WHERE saved_at < ?", (now - ttl,))
+        finally:
+            conn.close()
+    except Exception as e:
+        log(f"[CDP 캐시] 저장 실패: {e}")
+
+
+# CDP 연결은 프로세스 동안 재사용 (키워드마다 탭 조회 + 웹소켓 핸드셰이크 생략)
+_cdp_calculator = None
+_cdp_lock = threading.Lock()  # 여러 폰 동시 실행 시 크롬 탭/캐시 파일은 하나씩
+
+
+def _get_cdp_calculator():
+    """연결된 CDPCalculator 가져오기 (끊겼으면 재연결)
+
+    Returns:
+        CDPCalculator: 연결 실패 시 None
+    """
+    global _cdp_calculator
+
+    if _cdp_calculator is None:
+        _cdp_calculator = CDPCalculator(port=CDP_CONFIG.get("port", 9222))
+        atexit.register(_cdp_calculator.close)
+
+    if not _cdp_calculator.connected and not _cdp_calculator.connect():
+        return None
+    return _cdp_calculator
+
+
+def get_cdp_scroll_info(keyword, domain, screen_width, screen_height):
+    """스크롤 정보 가져오기 (캐시 → 없으면 CDP 계산)
+
+    Returns:
+        dict: cdp_info (CDP 연결 실패 시 None)
+    """
+    # 같은 검색어를 여러 폰이 동시에 요청하면 첫 폰이 계산, 나머지는 캐시 사용
+    with _cdp_lock:
+        return _get_cdp_scroll_info_locked(keyword, domain, screen_width, screen_height)
+
+
+def _get_cdp_scroll_info_locked(keyword, domain, screen_width, screen_height):
+    cdp_info = load_cached_scroll_info(keyword, domain, screen_width, screen_height)
+    if cdp_info:
+        return cdp_info
+
+    if not CDP_AVAILABLE:
+        return None
+
+    # 계산 중 연결이 끊기면 1번만 재연결 후 재시도
+    for _ in range(2):
+        cdp = _get_cdp_calculator()
+        if not cdp:
+            print("[CDP] 연결 실패, 기존 방식으로 진행")
+            return None
+
+        cdp_info = cdp.calculate_scroll_info(keyword, domain, screen_width, screen_height)
+        if cdp_info["calculated"] or cdp.connected:
+            break
+        log("[CDP] 연결 끊김, 재연결 후 재시도...")
+
+    save_cached_scroll_info(keyword, domain, screen_width, screen_height, cdp_info)
+    return cdp_info
+
+
+class ADBShellSession:
+    """adb shell 세션 하나를 계속 열어두고 명령을 흘려보내는 방식
+
+    명령마다 adb 프로세스를 새로 띄우면 연결/fork 비용이 매번 듦.
+    명령 뒤에 종료 표시를 echo 해서 출력 끝을 구분함.
+    (보내는 줄은 따옴표로 끊어 써서 PTY가 입력을 되돌려 보내도 표시와 안 겹침)
+    """
+    END_MARKER = "__ADB_CMD_END__"
+    END_ECHO = 'echo __ADB_CMD_""END__'
+
+    def __init__(self, adb_path, adb_address):
+        self.proc = subprocess.Popen(
+            [adb_path, "-s", adb_address, "shell"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            encoding="utf-8", errors="ignore", bufsize=1
+        )
+        self._lines = queue.Queue()
+        reader = threading.Thread(target=self._read_stdout, daemon=True)
+        reader.start()
+
+    def _read_stdout(self):
+        for line in self.proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)  # 세션 종료 표시
+
+    @property
+    def alive(self):
+        return self.proc.poll() is None
+
+    def send(self, command):
+        """명령 전송 (세션이 죽어 있으면 BrokenPipeError 등 예외 = 폰에 안 감)"""
+        self.proc.stdin.write(f"{command} </dev/null; {self.END_ECHO}\n")
+        self.proc.stdin.flush()
+
+    def read_output(self, timeout):
+        """보낸 명령의 출력 읽기 (타임아웃/세션 종료 시 예외 - 명령은 이미 폰에 감)"""
+        deadline = time.time() + timeout
+        output = []
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError(f"adb shell 응답 없음 ({timeout}초)")
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError(f"adb shell 응답 없음 ({timeout}초)")
+            if line is None:
+                raise ConnectionError("adb shell 세션 종료됨")
+            if line.rstrip("\r\n").endswith(self.END_MARKER):
+                # 출력이 개행 없이 끝난 경우 표시 앞부분은 출력에 포함
+                head = line.rstrip("\r\n")[:-len(self.END_MARKER)]
+                if head:
+                    output.append(head)
+                break
+            output.append(line)
+        return "".join(output).strip()
+
+    def run(self, command, timeout):
+        """명령 실행 후 출력 반환 (타임아웃/세션 종료 시 예외)"""
+        self.send(command)
+        return self.read_output(timeout)
+
+    def close(self):
+        try:
+            self.proc.stdin.write("exit\n")
+            self.proc.stdin.flush()
+            self.proc.wait(timeout=2)
+        except Exception:
+            self.proc.kill()
+
+
 class ADBController:
     def __init__(self, phone_config):
         self.adb_path = ADB_CONFIG["adb_path"]
@@ -560,14 +1104,23 @@ class ADBController:
         self.screen_height = phone_config.get("screen_height", 1440)
         self._last_xml = None
         self._last_xml_time = 0
+        self._dump_to_tty = True  # exec-out 덤프 지원 여부 (실패 시 파일 방식으로 전환)
         self._scroll_debt = 0  # 보상 스크롤용 오차 누적
+        self._shell_session = None  # 유지 중인 adb shell 세션
+        self._domain_scan = None  # 마지막 도메인 검색 (xml, 도메인, 결과) - 같은 화면 재파싱 방지
+        self._key_xy = self._build_key_table()  # 이 폰 해상도 기준 키 좌표
     
-    def run_adb(self, command, timeout=None):
+    def run_adb(self, args, timeout=None):
+        """adb 명령 실행 (PC 쪽 셸 없이 바로 실행)
+
+        Args:
+            args: adb 인자 리스트 (예: ["shell", "input tap 1 2"])
+        """
         timeout = timeout or ADB_CONFIG["command_timeout"]
-        full_command = f'{self.adb_path} -s {self.adb_address} {command}'
+        full_command = [self.adb_path, "-s", self.adb_address, *args]
         try:
             result = subprocess.run(
-                full_command, shell=True, capture_output=True,
+                full_command, capture_output=True,
                 timeout=timeout, encoding='utf-8', errors='ignore'
             )
             return result.stdout.strip() if result.stdout else ""
@@ -575,15 +1128,65 @@ class ADBController:
             log(f"ADB 실행 실패: {e}", "ERROR")
             return None
     
-    def shell(self, command):
-        return self.run_adb(f'shell {command}')
+    def shell(self, command, timeout=None):
+        timeout = timeout or ADB_CONFIG["command_timeout"]
+        if not ADB_CONFIG.get("persistent_shell", True):
+            return self.run_adb(["shell", command], timeout=timeout)
+        
+        try:
+            session = self._get_shell_session()
+            session.send(command)
+        except Exception as e:
+            # 세션을 못 열었거나 전송 실패 → 폰에 안 갔으니 일회성 실행으로 대체
+            log(f"[경고] adb shell 세션 오류, 단일 실행으로 대체: {e}")
+            self.close_shell_session()
+            return self.run_adb(["shell", command], timeout=timeout)
+        
+        try:
+            return session.read_output(timeout)
+        except Exception as e:
+            # 이미 폰에 간 명령 (탭/스와이프는 두 번 하면 안 됨) → 재실행 없이 세션만 정리
+            log(f"[오류] adb shell 응답 없음, 재실행 안 함: {e}", "ERROR")
+            self.close_shell_session()
+            return None
+    
+    def shell_batch(self, commands, batch_size=12):
+        """명령 여러 개를 ';'로 묶어서 전송 (일정 개수씩 끊어서)
+
+        타임아웃은 묶음 안의 폰 쪽 sleep 합 + input 명령 수에 맞춰 늘림.
+        응답이 없으면 남은 묶음은 보내지 않음 (다시 보내면 입력이 중복됨)
+
+        Returns:
+            bool: 전부 전송 완료 여부
+        """
+        per_input = ADB_CONFIG.get("batch_input_timeout", 1.5)
+        for i in range(0, len(commands), batch_size):
+            chunk = commands[i:i + batch_size]
+            sleeps = sum(float(cmd.split()[1]) for cmd in chunk if cmd.startswith("sleep "))
+            inputs = sum(1 for cmd in chunk if cmd.startswith("input "))
+            timeout = ADB_CONFIG["command_timeout"] + sleeps + inputs * per_input
+            if self.shell("; ".join(chunk), timeout=timeout) is None:
+                log(f"[오류] 연속 입력 중단 ({i}/{len(commands)}개 전송 후 응답 없음)", "ERROR")
+                return False
+        return True
+    
+    def _get_shell_session(self):
+        """adb shell 세션 (없거나 끊겼으면 새로 열기)"""
+        if self._shell_session is None or not self._shell_session.alive:
+            self._shell_session = ADBShellSession(self.adb_path, self.adb_address)
+        return self._shell_session
+    
+    def close_shell_session(self):
+        if self._shell_session:
+            self._shell_session.close()
+            self._shell_session = None
     
     # ──────────────────────────────────────────
     # 연결
     # ──────────────────────────────────────────
     def connect(self):
         log(f"ADB 연결 시도: {self.adb_address}")
-        result = self.run_adb(f"connect {self.adb_address}")
+        result = self.run_adb(["connect", self.adb_address])
         
         if result and ("connected" in result.lower() or "already" in result.lower()):
             log("ADB 연결 성공!")
@@ -600,11 +1203,14 @@ class ADBController:
     # ──────────────────────────────────────────
     def tap(self, x, y, randomize=True):
         if randomize:
-            x += random.randint(-TOUCH_CONFIG["tap_random_x"], TOUCH_CONFIG["tap_random_x"])
-            y += random.randint(-TOUCH_CONFIG["tap_random_y"], TOUCH_CONFIG["tap_random_y"])
+            rx = TOUCH_CONFIG["tap_random_x"]
+            ry = TOUCH_CONFIG["tap_random_y"]
+            x += _randrange(-rx, rx + 1)
+            y += _randrange(-ry, ry + 1)
         x = max(0, min(int(x), self.screen_width))
         y = max(0, min(int(y), self.screen_height))
-        log(f"탭: ({x}, {y})")
+        if VERBOSE:
+            log(f"탭: ({x}, {y})")
         self.shell(f"input tap {x} {y}")
         random_delay(TOUCH_CONFIG["after_tap_delay_min"], TOUCH_CONFIG["after_tap_delay_max"])
     
@@ -625,20 +1231,20 @@ class ADBController:
             return False
         
         # 요소 내부 랜덤 좌표 (가장자리 15% 제외)
-        margin_x = max(2, int((x2 - x1) * 0.15))
-        margin_y = max(2, int((y2 - y1) * 0.15))
-        
-        x = random.randint(x1 + margin_x, max(x1 + margin_x, x2 - margin_x))
-        y = random.randint(y1 + margin_y, max(y1 + margin_y, y2 - margin_y))
+        x_lo, x_hi, y_lo, y_hi = click_box(bounds)
+        x = _randrange(x_lo, x_hi + 1)
+        y = _randrange(y_lo, y_hi + 1)
         
-        log(f"요소 탭: [{x1},{y1}][{x2},{y2}] → ({x}, {y})")
+        if VERBOSE:
+            log(f"요소 탭: [{x1},{y1}][{x2},{y2}] → ({x}, {y})")
         self.tap(x, y, randomize=False)
         return True
     
     def swipe(self, x1, y1, x2, y2, duration_ms=None):
         if duration_ms is None:
             duration_ms = random.randint(SCROLL_CONFIG["duration_min"], SCROLL_CONFIG["duration_max"])
-        log(f"스와이프: ({int(x1)}, {int(y1)}) → ({int(x2)}, {int(y2)}), {duration_ms}ms")
+        if VERBOSE:
+            log(f"스와이프: ({int(x1)}, {int(y1)}) → ({int(x2)}, {int(y2)}), {duration_ms}ms")
         self.shell(f"input swipe {int(x1)} {int(y1)} {int(x2)} {int(y2)} {duration_ms}")
     
     def scroll_down(self, distance=None, fixed=False, compensated=False):
@@ -749,98 +1355,73 @@ class ADBController:
         if has_korean:
             return self.input_korean_keyboard(text)
         else:
-            escaped = text.replace(' ', '%s').replace('&', '\\&')
-            self.shell(f'input text "{escaped}"')
+            # 명령 문자열이 폰 셸에서 그대로 해석되므로 통째로 따옴표 처리
+            escaped = text.replace(' ', '%s')
+            self.shell(f'input text {shlex.quote(escaped)}')
             random_delay(TYPING_CONFIG["after_typing_delay_min"], TYPING_CONFIG["after_typing_delay_max"])
             return True
     
     def input_korean_keyboard(self, text):
-        """한글 키보드 자판 탭으로 입력"""
+        """한글 키보드 자판 탭으로 입력
+
+        자모마다 shell 왕복하지 않고, 탭 + 폰 쪽 sleep을 한 줄로 묶어서 보냄
+        (탭 간격 랜덤은 PC에서 미리 뽑음)
+        """
         log(f"한글 키보드 입력: {text}")
         
         jamos = self._decompose_korean(text)
         log(f"자모 분리: {''.join(jamos)}")
         
+        commands = []
         for jamo in jamos:
-            if jamo == ' ':
-                self._tap_key('space')
-            elif jamo in KEYBOARD_LAYOUT:
-                self._tap_key(jamo)
-            else:
+            key = 'space' if jamo == ' ' else jamo
+            if key not in self._key_xy:
                 log(f"[경고] 키보드에 없는 문자: {jamo}")
-            
-            time.sleep(random.uniform(0.08, 0.18))
+                continue
+            commands.extend(self._key_tap_commands(key))
+            commands.append(f"sleep {random.uniform(0.08, 0.18):.2f}")
         
+        if not self.shell_batch(commands):
+            return False
         random_delay(0.3, 0.5)
         return True
     
     def _decompose_korean(self, text):
         """한글을 자모로 분리"""
         result = []
-        
-        CHOSUNG = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
-        JUNGSUNG = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ']
-        JONGSUNG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
-        
-        COMPLEX_VOWEL = {
-            'ㅘ': ['ㅗ', 'ㅏ'], 'ㅙ': ['ㅗ', 'ㅐ'], 'ㅚ': ['ㅗ', 'ㅣ'],
-            'ㅝ': ['ㅜ', 'ㅓ'], 'ㅞ': ['ㅜ', 'ㅔ'], 'ㅟ': ['ㅜ', 'ㅣ'],
-            'ㅢ': ['ㅡ', 'ㅣ'], 'ㅒ': ['ㅑ', 'ㅣ'], 'ㅖ': ['ㅕ', 'ㅣ'],
-        }
-        
-        COMPLEX_JONG = {
-            'ㄳ': ['ㄱ', 'ㅅ'], 'ㄵ': ['ㄴ', 'ㅈ'], 'ㄶ': ['ㄴ', 'ㅎ'],
-            'ㄺ': ['ㄹ', 'ㄱ'], 'ㄻ': ['ㄹ', 'ㅁ'], 'ㄼ': ['ㄹ', 'ㅂ'],
-            'ㄽ': ['ㄹ', 'ㅅ'], 'ㄾ': ['ㄹ', 'ㅌ'], 'ㄿ': ['ㄹ', 'ㅍ'],
-            'ㅀ': ['ㄹ', 'ㅎ'], 'ㅄ': ['ㅂ', 'ㅅ'],
-        }
-        
         for char in text:
             if '\uac00' <= char <= '\ud7a3':
-                code = ord(char) - 0xAC00
-                cho = code // 588
-                jung = (code % 588) // 28
-                jong = code % 28
-                
-                result.append(CHOSUNG[cho])
-                
-                vowel = JUNGSUNG[jung]
-                if vowel in COMPLEX_VOWEL:
-                    result.extend(COMPLEX_VOWEL[vowel])
-                else:
-                    result.append(vowel)
-                
-                if jong > 0:
-                    jongchar = JONGSUNG[jong]
-                    if jongchar in COMPLEX_JONG:
-                        result.extend(COMPLEX_JONG[jongchar])
-                    else:
-                        result.append(jongchar)
-            elif '\u3131' <= char <= '\u3163':
-                result.append(char)
+                result.extend(decompose_syllable(char))
             else:
                 result.append(char)
-        
         return result
     
-    def _tap_key(self, key):
-        """키보드 키 탭"""
-        if key not in KEYBOARD_LAYOUT:
-            log(f"[경고] 키 없음: {key}")
-            return
-        
-        coords = KEYBOARD_LAYOUT[key]
-        
-        if coords.get('shift'):
-            shift_coords = KEYBOARD_LAYOUT['shift']
-            sx = shift_coords['x'] + random.randint(-5, 5)
-            sy = shift_coords['y'] + random.randint(-3, 3)
-            self.shell(f"input tap {sx} {sy}")
-            time.sleep(random.uniform(0.05, 0.1))
-        
-        x = coords['x'] + random.randint(-8, 8)
-        y = coords['y'] + random.randint(-5, 5)
-        self.shell(f"input tap {x} {y}")
+    def _build_key_table(self):
+        """KEYBOARD_LAYOUT을 이 폰 해상도로 한 번만 변환
+
+        Returns:
+            dict: {키: (x, y, shift 필요 여부)}
+        """
+        base_width, base_height = KEYBOARD_LAYOUT_SIZE
+        sx = self.screen_width / base_width
+        sy = self.screen_height / base_height
+        return {
+            key: (round(coords['x'] * sx), round(coords['y'] * sy), coords.get('shift', False))
+            for key, coords in KEYBOARD_LAYOUT.items()
+        }
+    
+    def _key_tap_commands(self, key):
+        """키보드 키 탭 명령 목록 (쌍자음 등은 shift 먼저)"""
+        x, y, needs_shift = self._key_xy[key]
+        commands = []
+        
+        if needs_shift:
+            shift_x, shift_y, _ = self._key_xy['shift']
+            commands.append(f"input tap {shift_x + random.randint(-5, 5)} {shift_y + random.randint(-3, 3)}")
+            commands.append(f"sleep {random.uniform(0.05, 0.1):.2f}")
+        
+        commands.append(f"input tap {x + random.randint(-8, 8)} {y + random.randint(-5, 5)}")
+        return commands
     
     # ──────────────────────────────────────────
     # 브라우저 제어
@@ -854,15 +1435,15 @@ class ADBController:
             
             time.sleep(2)
             
-            # 브라우저 로딩 확인 (최대 5초)
-            for _ in range(10):
+            # 브라우저 로딩 확인 (최대 10번)
+            def naver_loaded():
                 xml = self.get_screen_xml(force=True)
-                if xml and len(xml) > 500:
-                    if "naver" in xml.lower() or "MM_SEARCH" in xml or "검색" in xml:
-                        log(f"[확인] 브라우저 로딩 완료!")
-                        random_delay(1.0, 2.0)
-                        return True
-                time.sleep(0.5)
+                return xml and len(xml) > 500 and NAVER_LOADED_RE.search(xml)
+            
+            if poll_until(naver_loaded, 10):
+                log(f"[확인] 브라우저 로딩 완료!")
+                random_delay(1.0, 2.0)
+                return True
             
             if attempt < max_retry:
                 log(f"[재시도] 브라우저 로딩 안 됨...")
@@ -881,13 +1462,55 @@ class ADBController:
         if not force and self._last_xml and (now - self._last_xml_time) < 0.3:
             return self._last_xml
         
-        self.shell("uiautomator dump /sdcard/screen.xml")
-        xml = self.shell("cat /sdcard/screen.xml")
+        xml = None
+        if ADB_CONFIG.get("persistent_shell", True):
+            xml = self._dump_xml_session()
+        elif self._dump_to_tty:
+            xml = self._dump_xml_direct()
+        if xml is None:
+            self.shell("uiautomator dump /sdcard/screen.xml")
+            xml = self.shell("cat /sdcard/screen.xml")
         
         self._last_xml = xml
         self._last_xml_time = now
         return xml
     
+    def _dump_xml_session(self):
+        """유지 중인 shell 세션에서 덤프 + cat 한 번에 (adb 프로세스 새로 안 띄움)
+
+        Returns:
+            str: XML (실패 시 None)
+        """
+        output = self.shell("uiautomator dump /sdcard/screen.xml >/dev/null && cat /sdcard/screen.xml")
+        if not output:
+            return None
+        
+        start = output.find("<?xml")
+        end = output.rfind("</hierarchy>")
+        if start == -1 or end == -1:
+            return None
+        return output[start:end + len("</hierarchy>")]
+    
+    def _dump_xml_direct(self):
+        """exec-out으로 덤프를 stdout에 바로 받기 (파일 저장 + cat 왕복 생략)
+
+        Returns:
+            str: XML (지원 안 하는 기기면 None)
+        """
+        output = self.run_adb(["exec-out", "uiautomator", "dump", "/dev/tty"])
+        if not output:
+            return None
+        
+        start = output.find("<?xml")
+        end = output.rfind("</hierarchy>")
+        if start == -1 or end == -1:
+            log("[경고] /dev/tty 덤프 미지원, 파일 방식으로 전환")
+            self._dump_to_tty = False
+            return None
+        
+        # 뒤에 붙는 "UI hierchary dumped to: /dev/tty" 제거
+        return output[start:end + len("</hierarchy>")]
+    
     def find_element_by_resource_id(self, resource_id, xml=None):
         """리소스 ID로 요소 찾기"""
         if xml is None:
@@ -895,14 +1518,12 @@ class ADBController:
         if not xml:
             return {"found": False}
         
-        # bounds와 resource-id 순서 무관하게 찾기
-        pattern1 = rf'resource-id="[^"]*{re.escape(resource_id)}[^"]*"[^>]*bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"'
-        pattern2 = rf'bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"[^>]*resource-id="[^"]*{re.escape(resource_id)}[^"]*"'
-        
-        match = re.search(pattern1, xml) or re.search(pattern2, xml)
+        # 노드 하나만 찾고 속성은 따로 읽음 (bounds/resource-id 순서 무관)
+        match = resource_id_node_re(resource_id).search(xml)
+        bounds = BOUNDS_RE.match(node_attrs(match.group(0)).get("bounds", "")) if match else None
         
-        if match:
-            x1, y1, x2, y2 = map(int, match.groups())
+        if bounds:
+            x1, y1, x2, y2 = map(int, bounds.groups())
             return {
                 "found": True,
                 "bounds": (x1, y1, x2, y2),
@@ -920,56 +1541,30 @@ class ADBController:
         if not xml:
             return {"found": False}
         
-        # 더 정확한 패턴: node 전체에서 text와 bounds 추출
-        if partial:
-            # text="...검색결과 더보기..." 포함
-            node_pattern = rf'<node[^>]+text="([^"]*{re.escape(text)}[^"]*)"[^>]+bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"[^>]*/?>'
-        else:
-            # text="검색결과 더보기" 정확히
-            node_pattern = rf'<node[^>]+text="{re.escape(text)}"[^>]+bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"[^>]*/?>'
-        
-        match = re.search(node_pattern, xml)
-        
-        if match:
-            matched_text, x1, y1, x2, y2 = match.groups()
-            x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
-            
-            # bounds 유효성
-            if x1 == 0 and y1 == 0 and x2 == 0 and y2 == 0:
-                return {"found": False}
-            
-            return {
-                "found": True,
-                "text": matched_text,
-                "bounds": (x1, y1, x2, y2),
-                "center_x": (x1 + x2) // 2,
-                "center_y": (y1 + y2) // 2
-            }
+        # 노드 하나만 찾고 속성은 따로 읽음 (text/bounds 순서 무관)
+        # partial: text="...검색결과 더보기..." 포함 / 아니면 text="검색결과 더보기" 정확히
+        match = text_node_re(text, partial).search(xml)
+        if not match:
+            return {"found": False}
         
-        # 패턴 2: bounds가 text 앞에 있는 경우
-        if partial:
-            node_pattern2 = rf'<node[^>]+bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"[^>]+text="([^"]*{re.escape(text)}[^"]*)"[^>]*/?>'
-        else:
-            node_pattern2 = rf'<node[^>]+bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"[^>]+text="{re.escape(text)}"[^>]*/?>'
+        attrs = node_attrs(match.group(0))
+        bounds = BOUNDS_RE.match(attrs.get("bounds", ""))
+        if not bounds:
+            return {"found": False}
         
-        match = re.search(node_pattern2, xml)
+        x1, y1, x2, y2 = map(int, bounds.groups())
         
-        if match:
-            x1, y1, x2, y2, matched_text = match.groups()
-            x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
-            
-            if x1 == 0 and y1 == 0 and x2 == 0 and y2 == 0:
-                return {"found": False}
-            
-            return {
-                "found": True,
-                "text": matched_text,
-                "bounds": (x1, y1, x2, y2),
-                "center_x": (x1 + x2) // 2,
-                "center_y": (y1 + y2) // 2
-            }
+        # bounds 유효성
+        if x1 == 0 and y1 == 0 and x2 == 0 and y2 == 0:
+            return {"found": False}
         
-        return {"found": False}
+        return {
+            "found": True,
+            "text": attrs.get("text", ""),
+            "bounds": (x1, y1, x2, y2),
+            "center_x": (x1 + x2) // 2,
+            "center_y": (y1 + y2) // 2
+        }
     
     def find_all_elements_with_domain(self, domain, xml=None):
         """도메인이 포함된 모든 요소 찾기 (정확한 경로 매칭)
@@ -982,56 +1577,110 @@ class ADBController:
         if not xml:
             return []
 
+        # 직전과 같은 화면 + 같은 도메인이면 이전 결과 그대로 (스크롤 끝, 로딩 대기 등)
+        last = self._domain_scan
+        if last and last[1] == domain and last[0] == xml:
+            log(f"[ADB] 화면 변화 없음, 이전 결과 사용 ({len(last[2])}개 매칭)")
+            return list(last[2])
+
+        links = self._scan_domain_elements(domain, xml)
+        self._domain_scan = (xml, domain, links)
+        return list(links)
+
+    def _iter_domain_nodes(self, xml, base_domain):
+        """베이스 도메인이 text/content-desc에 들어있는 말단 노드 (XML 한 번 파싱)
+
+        content-desc를 text보다 우선 (기존 정규식과 동일). 파싱 실패 시 정규식으로 대체.
+
+        Yields:
+            tuple: (텍스트, x1, y1, x2, y2)
+        """
+        try:
+            root = ET.fromstring(xml)
+        except ET.ParseError:
+            log("[경고] XML 파싱 실패, 정규식으로 검색")
+            node_pattern = domain_patterns(base_domain)[1]
+            for match in node_pattern.finditer(xml):
+                text_found, x1, y1, x2, y2 = match.groups()
+                yield text_found, int(x1), int(y1), int(x2), int(y2)
+            return
+
+        needle = base_domain.lower()
+        for node in root.iter("node"):
+            if len(node):
+                continue  # 자식 있는 노드는 제외 (말단 노드만)
+
+            attrib = node.attrib
+            desc = attrib.get("content-desc", "")
+            if needle in desc.lower():
+                text_found = desc
+            else:
+                text_found = attrib.get("text", "")
+                if needle not in text_found.lower():
+                    continue
+
+            bounds = BOUNDS_RE.match(attrib.get("bounds", ""))
+            if not bounds:
+                continue
+            x1, y1, x2, y2 = map(int, bounds.groups())
+            yield text_found, x1, y1, x2, y2
+
+    def _scan_domain_elements(self, domain, xml):
+        """XML에서 도메인 요소 실제 검색 (find_all_elements_with_domain 내부용)"""
         # 경로 포함 여부 확인
         has_path = '/' in domain and not domain.endswith('/')
         base_domain = domain.split('/')[0]
 
+        # 화면에 도메인 문자열 자체가 없으면 노드 정규식(백트래킹 많음) 생략
+        # - 스크롤 중 대부분의 덤프는 여기서 바로 끝남
+        if not domain_patterns(base_domain)[0].search(xml):
+            return []
+
         links = []
         found_count = 0
-        # text 또는 content-desc에서 베이스 도메인 포함된 요소 찾기
-        node_pattern = rf'<node[^>]+(?:text|content-desc)="([^"]*{re.escape(base_domain)}[^"]*)"[^>]+bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"[^>]*/>'
+        excluded = {}  # 제외 사유별 개수 (요약 로그용)
+        detail_lines = []  # 노드별 상세 로그 (VERBOSE일 때만, 끝에 한 번에 출력)
 
-        for match in re.finditer(node_pattern, xml, re.IGNORECASE):
-            text_found, x1, y1, x2, y2 = match.groups()
-            x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+        # 노드마다 제외 사유 판정 → 집계/로그/결과 추가를 한 번에
+        for text_found, x1, y1, x2, y2 in self._iter_domain_nodes(xml, base_domain):
             found_count += 1
+            reason = None
+            detail = ""
+            text_lower = text_found.lower()  # 노드당 한 번만
 
-            # 유효한 bounds만
             if x1 == 0 and y1 == 0 and x2 == 0 and y2 == 0:
-                log(f"[ADB] 제외(bounds=0): {text_found[:50]}")
-                continue
-
-            # URL 인코딩된 텍스트 제외 (파비콘, 이미지 URL 등)
-            # sunny?src=https%3A%2F%2Fsidecut.co.kr%2Ffavicon 같은 것
-            if '%2F' in text_found or '%3A' in text_found or 'sunny?' in text_found.lower():
-                log(f"[ADB] 제외(URL인코딩): {text_found[:50]}")
-                continue
-
-            # http로 시작하는 URL 제외
-            if text_found.lower().startswith(('http://', 'https://')):
-                log(f"[ADB] 제외(http): {text_found[:50]}")
-                continue
-
-            # 정확한 매칭 체크
-            is_match = False
-            if has_path:
+                # 유효한 bounds만
+                reason = "bounds=0"
+            elif '%2F' in text_found or '%3A' in text_found or 'sunny?' in text_lower:
+                # URL 인코딩된 텍스트 제외 (파비콘, 이미지 URL 등)
+                # sunny?src=https%3A%2F%2Fsidecut.co.kr%2Ffavicon 같은 것
+                reason = "URL인코딩"
+            elif text_lower.startswith(('http://', 'https://')):
+                # http로 시작하는 URL 제외
+                reason = "http"
+            elif has_path:
                 # 경로가 지정된 경우: 정확한 경로 포함
-                if domain in text_found:
-                    is_match = True
+                if domain not in text_found:
+                    reason = "경로불일치"
             else:
                 # 경로가 없는 경우: 메인 도메인만 (서브링크 제외)
                 # "sidecut.co.kr"은 매칭, "sidecut.co.kr › lessons"나 "sidecut.co.kr/lessons"는 제외
                 # 도메인 뒤에 / 또는 › 또는 > 가 있으면 서브페이지
-                text_after_domain = text_found.split(domain)[-1].strip() if domain in text_found else ""
-                if domain in text_found and not text_after_domain.startswith(('/', '›', '>')):
-                    is_match = True
-                else:
-                    log(f"[ADB] 제외(서브페이지): {text_found[:50]} (뒤: '{text_after_domain[:20]}')")
-
-            if not is_match:
+                # 마지막 도메인 위치 뒤쪽만 확인 (split으로 전체를 쪼개지 않음)
+                pos = text_found.rfind(domain)
+                text_after_domain = text_found[pos + len(domain):].strip() if pos >= 0 else ""
+                if pos < 0 or text_after_domain.startswith(('/', '›', '>')):
+                    reason = "서브페이지"
+                    detail = f" (뒤: '{text_after_domain[:20]}')"
+
+            if reason:
+                excluded[reason] = excluded.get(reason, 0) + 1
+                if VERBOSE:
+                    detail_lines.append(f"[ADB] 제외({reason}): {text_found[:50]}{detail}")
                 continue
 
-            log(f"[ADB] ✓ 매칭! {text_found[:40]} bounds=[{x1},{y1}][{x2},{y2}]")
+            if VERBOSE:
+                detail_lines.append(f"[ADB] ✓ 매칭! {text_found[:40]} bounds=[{x1},{y1}][{x2},{y2}]")
             links.append({
                 "found": True,
                 "text": text_found,
@@ -1040,30 +1689,31 @@ class ADBController:
                 "center_y": (y1 + y2) // 2
             })
 
-        log(f"[ADB] 총 {found_count}개 요소 검사, {len(links)}개 매칭")
+        summary = f"[ADB] 총 {found_count}개 요소 검사, {len(links)}개 매칭"
+        if excluded:
+            summary += " (제외: " + ", ".join(f"{k} {v}" for k, v in excluded.items()) + ")"
+        detail_lines.append(summary)
+        log_lines(detail_lines)
         return links
     
     def click_search_button(self):
         """검색 버튼 클릭 - 키보드 검색 버튼 우선"""
         
         # 1순위: 키보드의 검색 버튼 (Gboard 우측 하단) - 가장 확실함
-        search_key = KEYBOARD_LAYOUT.get('search')
+        # 자모 탭과 같은 좌표계 (이 폰 해상도로 변환된 키 좌표)
+        search_key = self._key_xy.get('search')
         if search_key:
-            log(f"키보드 검색 버튼: ({search_key['x']}, {search_key['y']})")
-            self.tap(search_key['x'], search_key['y'], randomize=True)
+            x, y, _ = search_key
+            log(f"키보드 검색 버튼: ({x}, {y})")
+            self.tap(x, y, randomize=True)
             return True
         
         # 2순위: UI에서 검색 버튼 찾기 (화면 오른쪽만)
         xml = self.get_screen_xml(force=True)
         half_width = self.screen_width // 2
         
-        button_patterns = [
-            r'<node[^>]+content-desc="[^"]*검색[^"]*"[^>]+bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"',
-            r'<node[^>]+resource-id="[^"]*search[^"]*btn[^"]*"[^>]+bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"',
-        ]
-        
-        for pattern in button_patterns:
-            for match in re.finditer(pattern, xml, re.IGNORECASE):
+        for pattern in SEARCH_BUTTON_RES:
+            for match in pattern.finditer(xml):
                 x1, y1, x2, y2 = map(int, match.groups())
                 cx = (x1 + x2) // 2
                 
@@ -1082,11 +1732,49 @@ class ADBController:
 # 네이버 검색 자동화
 # ============================================
 class NaverSearchAutomation:
-    def __init__(self, adb: ADBController, cdp_info=None):
+    def __init__(self, adb: ADBController, cdp_info=None, cdp_future=None):
         self.adb = adb
         self.viewport_top = adb.screen_height * 0.15
         self.viewport_bottom = adb.screen_height * 0.85
+        self.set_cdp_info(cdp_info)
+        # 백그라운드 CDP 계산 (5단계 직전에 결과 받음)
+        self._cdp_future = cdp_future
+    
+    def _resolve_cdp_info(self):
+        """백그라운드 CDP 계산 결과 반영 (처음 필요할 때 한 번만 대기)"""
+        if self._cdp_future is None:
+            return
+        
+        future, self._cdp_future = self._cdp_future, None
+        if not future.done():
+            log("[CDP] 백그라운드 계산 완료 대기...")
+        
+        try:
+            self.set_cdp_info(future.result())
+        except Exception as e:
+            log(f"[CDP] 백그라운드 계산 실패: {e}")
+            self.set_cdp_info(None)
+    
+    def set_cdp_info(self, cdp_info):
+        """CDP 계산 결과 반영 + 5/7단계 실행 방식을 여기서 한 번만 결정"""
         self.cdp_info = cdp_info  # CDP 계산 결과
+        calculated = bool(cdp_info and cdp_info.get("calculated"))
+        
+        if calculated and cdp_info.get("more_scroll_count", 0) > 0:
+            self._step5_impl = self._step5_cdp_scroll
+        else:
+            self._step5_impl = self._step5_dump_scroll
+        
+        if calculated and cdp_info.get("domain_scroll_count", -1) >= 0:
+            self._step7_impl = self._step7_cdp_scroll
+        else:
+            self._step7_impl = self._step7_paging
+    
+    def _visible_links(self, links):
+        """화면 중앙 영역(viewport_top~bottom)에 있는 링크만 (한 번 순회)"""
+        top = self.viewport_top
+        bottom = self.viewport_bottom
+        return [link for link in links if top <= link["center_y"] <= bottom]
     
     # ========================================
     # 1단계: 네이버 메인 이동
@@ -1108,14 +1796,36 @@ class NaverSearchAutomation:
         log("[2단계] 검색창 클릭")
         log("=" * 50)
         
-        max_retry = WAIT_CONFIG.get("max_element_retry", 30)
+        # 시간 상한이 재시도 횟수보다 우선 (둘 중 먼저 닿는 쪽에서 실패)
+        max_retry = WAIT_CONFIG.get("max_element_retry", 15)
+        max_wait = WAIT_CONFIG.get("max_element_wait", 60)
         clicks_before_reload = 5
+        deadline = time.time() + max_wait
+        
+        def out_of_time(tried):
+            if time.time() < deadline:
+                return False
+            log(f"[실패] 검색창 클릭 시간 초과 ({max_wait}초, {tried}번 시도)", "ERROR")
+            return True
+        
+        def retry_wait(attempt, tried):
+            """백오프 대기 (마감까지 남은 시간 이내) 후 시간 남았는지"""
+            backoff_delay(attempt, max_delay=deadline - time.time())
+            return not out_of_time(tried)
         
         for retry in range(1, max_retry + 1):
+            if out_of_time(retry - 1):
+                return False
+            
             # 5번마다 메인 재이동 (CDP 동일)
             if retry > 1 and (retry - 1) % clicks_before_reload == 0:
                 log(f"[재이동] {clicks_before_reload}번 실패, 네이버 재이동...")
                 self.adb.open_url(NAVER_CONFIG["start_url"], max_retry=1)
+                if out_of_time(retry - 1):
+                    return False
+            
+            # 백오프 순번 (재이동하면 처음부터)
+            attempt = (retry - 1) % clicks_before_reload
             
             xml = self.adb.get_screen_xml(force=True)
             
@@ -1126,14 +1836,16 @@ class NaverSearchAutomation:
             
             if not element.get("found"):
                 log(f"[재시도 {retry}/{max_retry}] 검색창 못 찾음")
-                time.sleep(0.5)
+                if not retry_wait(attempt, retry):
+                    return False
                 continue
             
             # 화면 범위 체크
             cy = element.get("center_y", -1)
             if cy < 0 or cy > self.adb.screen_height:
                 log(f"[재시도 {retry}/{max_retry}] 검색창이 화면 밖")
-                time.sleep(0.5)
+                if not retry_wait(attempt, retry):
+                    return False
                 continue
             
             # 검색창 클릭
@@ -1156,7 +1868,8 @@ class NaverSearchAutomation:
                     time.sleep(0.3)
                     return True
             
-            time.sleep(0.5)
+            if not retry_wait(attempt, retry):
+                return False
         
         log(f"[실패] 검색창 클릭 {max_retry}번 실패", "ERROR")
         return False
@@ -1169,7 +1882,9 @@ class NaverSearchAutomation:
         log(f"[3단계] 검색어 입력: {keyword}")
         log("=" * 50)
         
-        self.adb.input_text(keyword)
+        if not self.adb.input_text(keyword):
+            log("[실패] 검색어 입력 중단", "ERROR")
+            return False
         random_delay(0.3, 0.5)
         return True
     
@@ -1208,13 +1923,14 @@ class NaverSearchAutomation:
         log("[대기] 검색 결과 로딩...")
         time.sleep(2)
         
-        # 1차 확인
-        for _ in range(8):  # 4초
+        def search_loaded():
             xml = self.adb.get_screen_xml(force=True)
-            if xml and ("search" in xml.lower() or "검색" in xml):
-                log("[성공] 검색 결과 로딩 완료!")
-                return True
-            time.sleep(0.5)
+            return xml and SEARCH_LOADED_RE.search(xml)
+        
+        # 1차 확인
+        if poll_until(search_loaded, 8):
+            log("[성공] 검색 결과 로딩 완료!")
+            return True
         
         # 1차 실패 → 엔터로 재시도 (CDP 동일)
         log("[재시도] 검색 결과 없음, 엔터로 재검색...")
@@ -1222,12 +1938,9 @@ class NaverSearchAutomation:
         time.sleep(2)
         
         # 2차 확인
-        for _ in range(8):
-            xml = self.adb.get_screen_xml(force=True)
-            if xml and ("search" in xml.lower() or "검색" in xml):
-                log("[성공] 검색 결과 로딩 완료!")
-                return True
-            time.sleep(0.5)
+        if poll_until(search_loaded, 8):
+            log("[성공] 검색 결과 로딩 완료!")
+            return True
         
         log("[경고] 검색 결과 확인 안 됨, 진행...")
         return True
@@ -1249,7 +1962,7 @@ class NaverSearchAutomation:
             
             if links:
                 # 화면 중앙에 있는 링크
-                visible = [l for l in links if self.viewport_top <= l["center_y"] <= self.viewport_bottom]
+                visible = self._visible_links(links)
                 
                 if visible:
                     log(f"[통합] {domain} 발견! {len(visible)}개 링크")
@@ -1262,7 +1975,7 @@ class NaverSearchAutomation:
                     # 다시 확인
                     xml = self.adb.get_screen_xml(force=True)
                     links = self.adb.find_all_elements_with_domain(domain, xml)
-                    visible = [l for l in links if self.viewport_top <= l["center_y"] <= self.viewport_bottom]
+                    visible = self._visible_links(links)
                     
                     if visible:
                         selected = random.choice(visible)
@@ -1289,68 +2002,99 @@ class NaverSearchAutomation:
         log("[5단계] '검색결과 더보기' 찾기")
         log("=" * 50)
         
+        # CDP 계산값 유무에 따른 방식은 set_cdp_info()에서 결정됨
+        self._resolve_cdp_info()
+        return self._step5_impl()
+    
+    def _cdp_blind_scroll(self, count, step_name, probe=None, probe_interval=0):
+        """CDP 계산 횟수만큼 덤프 없이 스크롤 (5/7단계 공통)
+
+        Args:
+            count: 스크롤 횟수
+            step_name: 로그용 단계 이름 (예: "5단계")
+            probe: 후반부에 호출할 조기 확인 함수 (결과가 참이면 중단)
+            probe_interval: probe 호출 간격 (스크롤 N회마다)
+
+        Returns:
+            probe 결과 (조기 발견 못 했으면 None)
+        """
+        # 스크롤 오차 초기화
+        self.adb.reset_scroll_debt()
+
+        # 후반부에만 조기 확인 (CDP 계산이 과하게 나온 경우 대비)
+        probe_from = count // 2
+        found = None
+
+        # 덤프 없이 빠르게 스크롤 (compensated=True: 랜덤이지만 총 이동량 정확)
+        for i, (delay, is_pause) in enumerate(draw_scroll_delays(count)):
+            self.adb.scroll_down(compensated=True)
+
+            # 읽기 멈춤 (확률적) - 대기시간은 루프 전에 미리 뽑아둠
+            if is_pause:
+                log(f"읽기 멈춤: {delay:.1f}초")
+            time.sleep(delay)
+
+            done = i + 1
+            if done % 10 == 0:
+                log(f"[{step_name}] 스크롤 {done}/{count}...")
+
+            if probe and probe_interval and probe_from < done < count and done % probe_interval == 0:
+                found = probe()
+                if found:
+                    log(f"[{step_name}] 조기 발견! 스크롤 {done}/{count}회에서 중단")
+                    break
+
+        log(f"[CDP] 스크롤 완료, 최종 오차: {self.adb.get_scroll_debt()}px")
+        return found or None
+    
+    def _step5_cdp_scroll(self):
+        """CDP 계산값만큼 덤프 없이 스크롤 후 더보기 찾기"""
         target = NAVER_CONFIG.get("target_text", "검색결과 더보기")
-        max_scrolls = NAVER_CONFIG.get("max_scrolls", 50)
         short_scroll = int(self.adb.screen_height * 0.3)
         
-        # CDP 계산값 사용 (있으면)
-        if self.cdp_info and self.cdp_info.get("calculated") and self.cdp_info.get("more_scroll_count", 0) > 0:
-            cdp_scroll = self.cdp_info["more_scroll_count"]
-            log(f"[CDP] 계산값 사용: {cdp_scroll}번 스크롤 (보상 모드)")
+        cdp_scroll = self.cdp_info["more_scroll_count"]
+        log(f"[CDP] 계산값 사용: {cdp_scroll}번 스크롤 (보상 모드)")
 
-            # 스크롤 오차 초기화
-            self.adb.reset_scroll_debt()
+        self._cdp_blind_scroll(cdp_scroll, "5단계")
 
-            # 덤프 없이 빠르게 스크롤 (compensated=True: 랜덤이지만 총 이동량 정확)
-            for i in range(cdp_scroll):
-                self.adb.scroll_down(compensated=True)
-
-                # 읽기 멈춤 (확률적)
-                if READING_PAUSE_CONFIG["enabled"] and random.random() < READING_PAUSE_CONFIG["probability"]:
-                    pause = random.uniform(READING_PAUSE_CONFIG["min_time"], READING_PAUSE_CONFIG["max_time"])
-                    log(f"읽기 멈춤: {pause:.1f}초")
-                    time.sleep(pause)
-                else:
-                    time.sleep(random.uniform(0.1, 0.2))
+        # 여유분 스크롤 1회 추가 (420~550px)
+        extra_scroll = random.randint(420, 550)
+        log(f"[5단계] 여유분 스크롤: {extra_scroll}px")
+        self.adb.scroll_down(extra_scroll)
+        time.sleep(random.uniform(0.2, 0.4))
 
-                if (i + 1) % 10 == 0:
-                    log(f"[5단계] 스크롤 {i + 1}/{cdp_scroll}...")
-
-            log(f"[CDP] 스크롤 완료, 최종 오차: {self.adb.get_scroll_debt()}px")
+        # 덤프해서 더보기 찾기
+        xml = self.adb.get_screen_xml(force=True)
+        element = self.adb.find_element_by_text(target, xml=xml)
 
-            # 여유분 스크롤 1회 추가 (420~550px)
-            extra_scroll = random.randint(420, 550)
-            log(f"[5단계] 여유분 스크롤: {extra_scroll}px")
-            self.adb.scroll_down(extra_scroll)
-            time.sleep(random.uniform(0.2, 0.4))
+        if element.get("found"):
+            cy = element["center_y"]
+            if self.viewport_top <= cy <= self.viewport_bottom:
+                log(f"[발견] '{target}' y={cy}")
+                return element
 
-            # 덤프해서 더보기 찾기
+        # 못 찾으면 추가 스크롤 (덤프하며)
+        log("[5단계] 못 찾음, 추가 스크롤...")
+        for extra in range(10):
+            self.adb.scroll_down(short_scroll)
+            time.sleep(0.3)
             xml = self.adb.get_screen_xml(force=True)
             element = self.adb.find_element_by_text(target, xml=xml)
-            
             if element.get("found"):
                 cy = element["center_y"]
                 if self.viewport_top <= cy <= self.viewport_bottom:
-                    log(f"[발견] '{target}' y={cy}")
+                    log(f"[발견] '{target}' y={cy} (추가 {extra + 1}회)")
                     return element
-            
-            # 못 찾으면 추가 스크롤 (덤프하며)
-            log("[5단계] 못 찾음, 추가 스크롤...")
-            for extra in range(10):
-                self.adb.scroll_down(short_scroll)
-                time.sleep(0.3)
-                xml = self.adb.get_screen_xml(force=True)
-                element = self.adb.find_element_by_text(target, xml=xml)
-                if element.get("found"):
-                    cy = element["center_y"]
-                    if self.viewport_top <= cy <= self.viewport_bottom:
-                        log(f"[발견] '{target}' y={cy} (추가 {extra + 1}회)")
-                        return element
-            
-            log(f"[실패] '{target}' 못 찾음", "ERROR")
-            return None
+
+        log(f"[실패] '{target}' 못 찾음", "ERROR")
+        return None
+    
+    def _step5_dump_scroll(self):
+        """CDP 없으면 기존 방식 (매번 덤프)"""
+        target = NAVER_CONFIG.get("target_text", "검색결과 더보기")
+        max_scrolls = NAVER_CONFIG.get("max_scrolls", 50)
+        short_scroll = int(self.adb.screen_height * 0.3)
         
-        # CDP 없으면 기존 방식 (매번 덤프)
         log("[5단계] 기존 방식 (CDP 없음)")
         for scroll_count in range(max_scrolls):
             xml = self.adb.get_screen_xml(force=True)
@@ -1398,24 +2142,24 @@ class NaverSearchAutomation:
             # 10초 단위로 체크하면서 재클릭 (CDP 동일: 10초 * 5회 = 50초)
             max_reclick = 5
             
+            last_dump = {}  # 마지막 확인 덤프 (재클릭 때 재사용)
+            
+            def more_page_loaded():
+                last_dump["xml"] = self.adb.get_screen_xml(force=True)
+                return self.adb.find_element_by_resource_id("nx_query", last_dump["xml"]).get("found")
+            
             for reclick_try in range(max_reclick):
-                # 10초 대기 (0.5초 * 20)
-                for _ in range(20):
-                    xml = self.adb.get_screen_xml(force=True)
-                    nx = self.adb.find_element_by_resource_id("nx_query", xml)
-                    
-                    if nx.get("found"):
-                        log("[성공] 더보기 페이지 로딩 완료!")
-                        random_delay(1.0, 2.0)
-                        return True
-                    time.sleep(0.5)
+                # 최대 20번 확인
+                if poll_until(more_page_loaded, 20):
+                    log("[성공] 더보기 페이지 로딩 완료!")
+                    random_delay(1.0, 2.0)
+                    return True
                 
                 # URL 안 바뀌면 재클릭 (CDP 동일)
                 if reclick_try < max_reclick - 1:
                     log(f"[재클릭] 페이지 변경 없음, 재클릭 {reclick_try + 2}/{max_reclick}...")
-                    # 요소 다시 찾아서 클릭
-                    xml = self.adb.get_screen_xml(force=True)
-                    element = self.adb.find_element_by_text(target, xml=xml)
+                    # 요소 다시 찾아서 클릭 (방금 확인한 덤프 재사용 - 그 뒤로 조작 없음)
+                    element = self.adb.find_element_by_text(target, xml=last_dump["xml"])
                     if element.get("found"):
                         self.adb.tap_element(element)
             
@@ -1434,37 +2178,34 @@ class NaverSearchAutomation:
         log(f"[7단계] '{domain}' 찾기")
         log("=" * 50)
         
-        # CDP 계산값 사용 (있으면)
-        if self.cdp_info and self.cdp_info.get("calculated") and self.cdp_info.get("domain_scroll_count", -1) >= 0:
-            cdp_scroll = self.cdp_info["domain_scroll_count"]
-            log(f"[CDP] 계산값 사용: {cdp_scroll}번 스크롤 (보상 모드)")
-
-            # 스크롤 오차 초기화
-            self.adb.reset_scroll_debt()
-
-            # 덤프 없이 빠르게 스크롤 (compensated=True: 랜덤이지만 총 이동량 정확)
-            for i in range(cdp_scroll):
-                self.adb.scroll_down(compensated=True)
-
-                if READING_PAUSE_CONFIG["enabled"] and random.random() < READING_PAUSE_CONFIG["probability"]:
-                    pause = random.uniform(READING_PAUSE_CONFIG["min_time"], READING_PAUSE_CONFIG["max_time"])
-                    log(f"읽기 멈춤: {pause:.1f}초")
-                    time.sleep(pause)
-                else:
-                    time.sleep(random.uniform(0.1, 0.2))
+        # CDP 계산값 유무에 따른 방식은 set_cdp_info()에서 결정됨
+        self._resolve_cdp_info()
+        return self._step7_impl(domain)
+    
+    def _step7_cdp_scroll(self, domain):
+        """CDP 계산값만큼 스크롤 후 도메인 찾아서 클릭"""
+        cdp_scroll = self.cdp_info["domain_scroll_count"]
+        log(f"[CDP] 계산값 사용: {cdp_scroll}번 스크롤 (보상 모드)")
 
-                if (i + 1) % 10 == 0:
-                    log(f"[7단계] 스크롤 {i + 1}/{cdp_scroll}...")
+        # 도메인이 이미 보이면 남은 스크롤 생략
+        def probe():
+            xml = self.adb.get_screen_xml(force=True)
+            links = self.adb.find_all_elements_with_domain(domain, xml)
+            return self._visible_links(links)
 
-            log(f"[CDP] 스크롤 완료, 최종 오차: {self.adb.get_scroll_debt()}px")
+        visible = self._cdp_blind_scroll(
+            cdp_scroll, "7단계", probe=probe,
+            probe_interval=CDP_CONFIG.get("domain_probe_interval", 3)
+        )
 
-            # 여유분 스크롤 제거 - 오버슈팅 방지
-            # 못 찾으면 추가 스크롤하면 됨
+        # 여유분 스크롤 제거 - 오버슈팅 방지
+        # 못 찾으면 추가 스크롤하면 됨
 
-            # 덤프해서 도메인 찾기
-            return self._find_and_click_domain_final(domain)
-        
-        # CDP 없거나 도메인 못 찾은 경우 → 기존 방식 (페이지별 탐색)
+        # 덤프해서 도메인 찾기 (조기 발견 시 그 결과 사용)
+        return self._find_and_click_domain_final(domain, visible)
+    
+    def _step7_paging(self, domain):
+        """CDP 없거나 도메인 못 찾은 경우 → 기존 방식 (페이지별 탐색)"""
         log("[7단계] 기존 방식 (CDP 없음)")
         
         max_page = NAVER_CONFIG.get("max_page", 10)
@@ -1489,14 +2230,19 @@ class NaverSearchAutomation:
         log(f"[실패] {domain} 못 찾음 ({max_page}페이지까지)", "ERROR")
         return False
     
-    def _find_and_click_domain_final(self, domain):
-        """CDP 스크롤 후 도메인 찾아서 클릭"""
+    def _find_and_click_domain_final(self, domain, visible=None):
+        """CDP 스크롤 후 도메인 찾아서 클릭
+
+        Args:
+            visible: 스크롤 중 이미 찾은 링크 (있으면 덤프 생략)
+        """
         short_scroll = int(self.adb.screen_height * 0.3)
         
         # 먼저 현재 위치에서 찾기
-        xml = self.adb.get_screen_xml(force=True)
-        links = self.adb.find_all_elements_with_domain(domain, xml)
-        visible = [l for l in links if self.viewport_top <= l["center_y"] <= self.viewport_bottom]
+        if not visible:
+            xml = self.adb.get_screen_xml(force=True)
+            links = self.adb.find_all_elements_with_domain(domain, xml)
+            visible = self._visible_links(links)
         
         if visible:
             return self._click_domain_link(visible, domain)
@@ -1509,7 +2255,7 @@ class NaverSearchAutomation:
             
             xml = self.adb.get_screen_xml(force=True)
             links = self.adb.find_all_elements_with_domain(domain, xml)
-            visible = [l for l in links if self.viewport_top <= l["center_y"] <= self.viewport_bottom]
+            visible = self._visible_links(links)
             
             if visible:
                 return self._click_domain_link(visible, domain)
@@ -1540,23 +2286,35 @@ class NaverSearchAutomation:
         # 다시 확인
         xml = self.adb.get_screen_xml(force=True)
         links = self.adb.find_all_elements_with_domain(domain, xml)
-        visible = [l for l in links if self.viewport_top <= l["center_y"] <= self.viewport_bottom]
+        visible = self._visible_links(links)
         
         if visible:
-            for click_try in range(3):
-                selected = random.choice(visible)
-                log(f"[클릭 {click_try + 1}/3] {selected['text'][:50]}...")
-                self.adb.tap_element(selected)
-                time.sleep(2)
-                
-                xml = self.adb.get_screen_xml(force=True)
-                nx = self.adb.find_element_by_resource_id("nx_query", xml)
-                
-                if not nx.get("found"):
-                    log("[성공] 페이지 이동!")
-                    return True
-                
-                log("[재시도] 페이지 변경 안 됨")
+            return self._tap_until_page_changes(visible)
+        
+        return False
+    
+    def _tap_until_page_changes(self, visible, max_try=3):
+        """보이는 링크 중 랜덤 클릭 → 검색 페이지(nx_query) 벗어날 때까지 재시도
+
+        Returns:
+            bool: 페이지 이동 성공 여부
+        """
+        # 클릭할 링크를 시도 횟수만큼 한 번에 뽑기 (중복 허용 = 기존 random.choice와 동일)
+        picks = random.choices(visible, k=max_try)
+        
+        for click_try, selected in enumerate(picks):
+            log(f"[클릭 {click_try + 1}/{max_try}] {selected['text'][:50]}...")
+            self.adb.tap_element(selected)
+            time.sleep(2)
+            
+            xml = self.adb.get_screen_xml(force=True)
+            nx = self.adb.find_element_by_resource_id("nx_query", xml)
+            
+            if not nx.get("found"):
+                log("[성공] 페이지 이동!")
+                return True
+            
+            log("[재시도] 페이지 변경 안 됨")
         
         return False
     
@@ -1570,7 +2328,7 @@ class NaverSearchAutomation:
             links = self.adb.find_all_elements_with_domain(domain, xml)
             
             if links:
-                visible = [l for l in links if self.viewport_top <= l["center_y"] <= self.viewport_bottom]
+                visible = self._visible_links(links)
                 
                 if visible:
                     log(f"[발견] {domain} 링크 {len(visible)}개!")
@@ -1583,25 +2341,10 @@ class NaverSearchAutomation:
                     # 다시 확인
                     xml = self.adb.get_screen_xml(force=True)
                     links = self.adb.find_all_elements_with_domain(domain, xml)
-                    visible = [l for l in links if self.viewport_top <= l["center_y"] <= self.viewport_bottom]
+                    visible = self._visible_links(links)
                     
                     if visible:
-                        for click_try in range(3):
-                            selected = random.choice(visible)
-                            log(f"[클릭 {click_try + 1}/3] {selected['text'][:50]}...")
-                            self.adb.tap_element(selected)
-                            time.sleep(2)
-                            
-                            xml = self.adb.get_screen_xml(force=True)
-                            nx = self.adb.find_element_by_resource_id("nx_query", xml)
-                            
-                            if not nx.get("found"):
-                                log("[성공] 페이지 이동!")
-                                return True
-                            
-                            log("[재시도] 페이지 변경 안 됨")
-                        
-                        return False
+                        return self._tap_until_page_changes(visible)
             
             self.adb.scroll_down(short_scroll)
             
@@ -1740,6 +2483,72 @@ class NaverSearchAutomation:
 # ============================================
 # 메인
 # ============================================
+def check_phone_aliases():
+    """PHONES 설정 점검 (이름 중복/별칭 충돌은 조용히 덮어쓰지 않고 경고로)
+
+    PHONES_BY_NAME은 이름 → 설정 dict라 이름이 겹치면 뒤쪽 폰만 남고,
+    이름이 다른 폰의 키와 같으면 키가 먼저 선택됨.
+
+    Returns:
+        list: 경고 문구 리스트
+    """
+    warnings = []
+    keys_by_name = {}
+    keys_by_address = {}
+    for key, config in PHONES.items():
+        name = config.get("name")
+        if name:
+            keys_by_name.setdefault(name, []).append(key)
+            if name in PHONES and PHONES[name] is not config:
+                warnings.append(f"폰 이름 '{name}'(키 {key})이 다른 폰의 키와 같음 - 키 '{name}' 폰이 선택됨")
+        address = config["adb_address"].strip().lower()
+        keys_by_address.setdefault(address, []).append(key)
+    
+    for name, keys in keys_by_name.items():
+        if len(keys) > 1:
+            warnings.append(f"폰 이름 '{name}' 중복 (키 {', '.join(keys)}) - 이름으로는 키 {keys[-1]}만 선택됨")
+    for address, keys in keys_by_address.items():
+        if len(keys) > 1:
+            warnings.append(f"같은 기기({address})가 여러 키에 등록됨 (키 {', '.join(keys)})")
+    return warnings
+
+
+def resolve_phones(phone_arg):
+    """폰 목록 인자 → 폰 설정 리스트 (쉼표로 여러 대, PHONES 키 또는 폰 이름)
+
+    같은 기기(adb 주소)는 한 번만 남김. 두 번 넣으면 한 기기에 스레드 두 개가
+    동시에 붙어서 탭/스와이프가 섞임.
+
+    Returns:
+        list: 폰 설정 리스트 (없는 폰이 있으면 None)
+    """
+    for warning in check_phone_aliases():
+        print(f"[경고] {warning}")
+    
+    phone_configs = []
+    seen_addresses = set()
+    for phone_key in phone_arg.split(","):
+        phone_key = phone_key.strip()
+        if not phone_key:
+            continue
+        phone_config = PHONES.get(phone_key) or PHONES_BY_NAME.get(phone_key)
+        if phone_config is None:
+            print(f"[오류] 폰 '{phone_key}' 없음")
+            return None
+        
+        address = phone_config["adb_address"].strip().lower()
+        if address in seen_addresses:
+            print(f"[경고] 폰 '{phone_key}' 중복 지정 ({address}), 한 번만 실행")
+            continue
+        seen_addresses.add(address)
+        phone_configs.append(phone_config)
+    
+    if not phone_configs:
+        print(f"[오류] 폰 지정 없음: '{phone_arg}'")
+        return None
+    return phone_configs
+
+
 def main():
     if len(sys.argv) < 3:
         print("사용법: python adb_auto_cdp.py 검색어 도메인 [검색모드] [폰번호] [마지막]")
@@ -1748,7 +2557,7 @@ def main():
         print("예시: python adb_auto_cdp.py 곤지암스키강습 sidecut.co.kr more 1 1")
         print("")
         print("[검색모드] total=통합에서만, more=더보기에서, both=통합→더보기 (기본값)")
-        print("[폰번호] config.py PHONES 키 (기본값: 1)")
+        print("[폰번호] config.py PHONES 키 또는 폰 이름, 쉼표로 여러 대 (기본값: 1)")
         print("[마지막] 0=중간, 1=마지막 키워드")
         return
     
@@ -1771,76 +2580,116 @@ def main():
             search_in_total = True
             go_to_more = True
     
-    phone_key = sys.argv[4] if len(sys.argv) >= 5 else "1"
+    phone_arg = sys.argv[4] if len(sys.argv) >= 5 else "1"
     is_last = sys.argv[5] in ["1", "true", "last"] if len(sys.argv) >= 6 else False
     
-    if phone_key not in PHONES:
-        print(f"[오류] 폰 '{phone_key}' 없음")
+    phone_configs = resolve_phones(phone_arg)
+    if not phone_configs:
         return
     
-    phone_config = PHONES[phone_key]
-    
     print("=" * 60)
     print("[ADB + CDP 통합 네이버 검색 v3]")
     print(f"[검색어] {keyword}")
     print(f"[도메인] {domain}")
     print(f"[모드] 통합:{search_in_total}, 더보기:{go_to_more}")
-    print(f"[폰] {phone_config.get('name', phone_key)}")
+    print(f"[폰] {', '.join(c.get('name', c['adb_address']) for c in phone_configs)}")
     print(f"[마지막] {'YES' if is_last else 'NO'}")
     print("=" * 60)
     
+    if len(phone_configs) == 1:
+        run_phone(phone_configs[0], keyword, domain, search_in_total, go_to_more, is_last)
+        return
+    
+    # 여러 폰: 폰마다 ADB 대기가 대부분이라 스레드로 동시 진행
+    with ThreadPoolExecutor(max_workers=len(phone_configs)) as executor:
+        futures = {
+            executor.submit(
+                run_phone, phone_config, keyword, domain,
+                search_in_total, go_to_more, is_last, True
+            ): phone_config["adb_address"]
+            for phone_config in phone_configs
+        }
+        results = {}
+        for future in as_completed(futures):
+            address = futures[future]
+            try:
+                results[address] = future.result()
+            except Exception as e:
+                log(f"[{address}] 실행 오류: {e}", "ERROR")
+                results[address] = "ERROR"
+    
+    print("\n" + "=" * 60)
+    for phone_config in phone_configs:
+        address = phone_config["adb_address"]
+        print(f"[{phone_config.get('name', address)}] {results[address]}")
+    print("=" * 60)
+
+
+def run_phone(phone_config, keyword, domain, search_in_total, go_to_more, is_last, tag_logs=False):
+    """폰 1대 자동화 실행 (연결 → CDP 계산 → 1~9단계, 전체 재시도 포함)
+
+    Args:
+        tag_logs: True면 이 스레드 로그 앞에 폰 이름 표시 (여러 폰 동시 실행용)
+
+    Returns:
+        str: "DONE", "NOTFOUND", "FAIL" 또는 "NOCONNECT"
+    """
+    if tag_logs:
+        _log_context.prefix = f"[{phone_config.get('name', phone_config['adb_address'])}] "
+    prefix = getattr(_log_context, "prefix", "")
+    
     # ADB 연결
     adb = ADBController(phone_config)
     if not adb.connect():
-        return
+        return "NOCONNECT"
+    atexit.register(adb.close_shell_session)
     
     # CDP 계산 (선택적 - 크롬 디버깅 모드 필요)
-    cdp_info = None
-    cdp = None
+    # PC 크롬 작업이라 폰 1~4단계와 무관 → 백그라운드로 동시 진행
+    cdp_future = None
     
-    if go_to_more and CDP_AVAILABLE:
-        print("\n[CDP 스크롤 계산]")
-        cdp = CDPCalculator(port=9222)
-        
-        if cdp.connect():
-            cdp_info = cdp.calculate_scroll_info(
-                keyword, domain,
-                adb.screen_width, adb.screen_height
-            )
-            cdp.close()
-        else:
-            print("[CDP] 연결 실패, 기존 방식으로 진행")
+    if go_to_more:
+        print(f"\n{prefix}[CDP 스크롤 계산] 백그라운드 시작 (1~4단계와 동시 진행)")
+        executor = ThreadPoolExecutor(max_workers=1)
+        cdp_future = executor.submit(
+            get_cdp_scroll_info,
+            keyword, domain,
+            adb.screen_width, adb.screen_height
+        )
+        executor.shutdown(wait=False)
     
     print("")
     
     # 자동화 실행
-    automation = NaverSearchAutomation(adb, cdp_info)
+    automation = NaverSearchAutomation(adb, cdp_future=cdp_future)
     max_retry = NAVER_CONFIG.get("max_full_retry", 2)
     
     for retry in range(max_retry + 1):
         if retry > 0:
             log(f"\n[전체 재시도 {retry}/{max_retry}]")
+            backoff_delay(retry - 1)
         
         result = automation.run(keyword, domain, search_in_total, go_to_more, is_last)
         
         if result == "DONE":
             print("\n" + "=" * 60)
-            print("[완료] 성공!")
+            print(f"{prefix}[완료] 성공!")
             print("=" * 60)
-            return
+            return "DONE"
         elif result == "NOTFOUND":
             print("\n" + "=" * 60)
-            print(f"[결과] {domain} 못 찾음")
+            print(f"{prefix}[결과] {domain} 못 찾음")
             print("=" * 60)
-            return
+            return "NOTFOUND"
         elif result == "RETRY" and retry < max_retry:
             continue
         else:
             break
     
     print("\n" + "=" * 60)
-    print("[실패]")
+    print(f"{prefix}[실패]")
     print("=" * 60)
+    return "FAIL"
 
 
 if __name__ == "__main__":
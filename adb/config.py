@@ -11,6 +11,12 @@ ADB_CONFIG = {
     
     # 기본 타임아웃 (초)
     "command_timeout": 30,
+    
+    # adb shell 세션 유지 (명령마다 adb 프로세스 새로 띄우지 않음)
+    "persistent_shell": True,
+    
+    # 묶음 전송 시 input 명령 1개당 추가 타임아웃 (초) - 폰에서 app_process 기동 시간
+    "batch_input_timeout": 1.5,
 }
 
 # ============================================
@@ -43,6 +49,9 @@ PHONES = {
     # },
 }
 
+# 폰 이름 → 설정 (명령줄에서 키 대신 이름으로도 지정 가능)
+PHONES_BY_NAME = {config["name"]: config for config in PHONES.values() if "name" in config}
+
 # ============================================
 # 브라우저 설정
 # ============================================
@@ -196,15 +205,20 @@ WAIT_CONFIG = {
     # 요소 대기 최대 시간 (초)
     "element_timeout": 20,
     
-    # 요소 체크 간격 (초)
+    # 요소 체크 간격 (초) - 처음 간격, 못 찾으면 2배씩 늘려서 최대값까지
     "element_check_interval": 0.3,
+    "element_check_interval_max": 0.5,
     
     # 요소 발견 후 추가 대기 (초)
     "after_element_found_min": 0.5,
     "after_element_found_max": 1.5,
     
     # 요소 찾기 최대 재시도 (2단계용)
-    "max_element_retry": 30,
+    # 시도 1회 = 덤프 + 탭 + 백오프(0.25→4초), 5회마다 재이동 → 60초 안에 대략 15회
+    "max_element_retry": 15,
+    
+    # 2단계 전체 시간 상한 (초) - 재시도 횟수보다 우선 (횟수가 남아도 넘으면 실패 처리)
+    "max_element_wait": 60,
 }
 
 # ============================================
@@ -226,8 +240,11 @@ RETRY_CONFIG = {
     # 전체 프로세스 재시도
     "max_full_retry": 2,
     
-    # 재시도 전 대기 (초)
-    "retry_delay": 2.0,
+    # 재시도 전 대기 (초) - 지수 백오프: min(cap, base * 2^n) + 랜덤(0~jitter)
+    # 빨리 뜨는 요소는 짧게, 안 뜨면 점점 길게 (최대 cap)
+    "retry_base": 0.25,
+    "retry_cap": 4.0,
+    "retry_jitter": 0.3,
 }
 
 # ============================================
@@ -337,11 +354,30 @@ CDP_CONFIG = {
     # 최대 여유 스크롤
     "margin_scroll_max": 5,
 
+    # ──────────────────────────────────────────
+    # 도메인 조기 확인
+    # 7단계 스크롤 후반부에 N회마다 덤프해서 도메인이 이미
+    # 보이면 남은 스크롤 생략 (0 = 사용 안 함)
+    # ──────────────────────────────────────────
+    "domain_probe_interval": 3,
+
     # ──────────────────────────────────────────
     # 페이지 로딩 대기
     # ──────────────────────────────────────────
-    "page_load_wait": 3.0,
+    "page_load_wait": 3.0,  # 최대 대기 (load 이벤트 오면 바로 진행)
     "after_scroll_wait": 0.3,
+
+    # ──────────────────────────────────────────
+    # 스크롤 계산 결과 캐시 (디스크 저장)
+    # 같은 검색어+도메인+해상도면 CDP 계산 생략
+    # ──────────────────────────────────────────
+    "cache_enabled": True,
+    # 캐시 파일 (adb_auto.py 기준 상대경로, sqlite)
+    "cache_file": ".scroll_cache.db",
+    # 스크롤 정보 갱신 주기 (N회마다 1번 갱신)
+    "cache_refresh_interval": 10,
+    # 캐시 유효 시간 (시간) - 검색 순위 변동 대비
+    "cache_ttl_hours": 6,
 }
 
 # ============================================
@@ -415,3 +451,6 @@ KEYBOARD_LAYOUT = {
     'ㅆ': {'x': 312, 'y': 1050, 'shift': True},
     'ㅉ': {'x': 96, 'y': 1050, 'shift': True},
 }
+
+# 위 좌표의 기준 해상도 (다른 해상도 폰은 비율로 변환해서 사용)
+KEYBOARD_LAYOUT_SIZE = (720, 1440)
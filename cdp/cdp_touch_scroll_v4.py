@@ -10,6 +10,7 @@ import time
 import random
 import sys
 import re
+from functools import lru_cache
 import requests
 import websocket
 import pyperclip
@@ -334,6 +335,9 @@ CONFIG = {
     # 크롬 디버깅 포트
     "chrome_port": 9222,
     
+    # 상세 로그 (글자별 타이핑 등 반복 구간 출력)
+    "verbose": True,
+    
     # 네이버 모바일 검색 URL
     "naver_mobile_url": "https://naver.com",
     
@@ -438,6 +442,8 @@ CONFIG = {
         "max_element_retry": 30,
         # 전체 재시도 횟수 (30번 실패 시 처음부터 다시)
         "max_full_retry": 2,
+        # 요소 대기 전체 상한 (초) - 30번 x 2회가 이보다 길어지면 중단
+        "max_element_wait": 180,
         # 5단계(더보기 찾기) 페이지 재이동 재시도 횟수
         "step5_full_retry": 1,
         # 6단계(더보기 클릭) 클릭 시도 횟수
@@ -865,7 +871,7 @@ def save_result(value):
 def get_websocket_url():
     """활성 탭의 WebSocket URL 가져오기"""
     try:
-        response = requests.get(f"http://localhost:{CONFIG['chrome_port']}/json")
+        response = requests.get(f"http://localhost:{CONFIG['chrome_port']}/json", timeout=5)
         tabs = response.json()
         
         # 네이버 탭 찾기 (검색 페이지 또는 메인)
@@ -939,7 +945,8 @@ class CDP:
             actual_delay = delay + random.uniform(-delay_random, delay_random)
             actual_delay = max(0.01, actual_delay)  # 최소 딜레이 보장
             
-            print(f"  [{i+1}/{len(text)}] '{char}' 입력, 딜레이: {actual_delay:.3f}초")
+            if CONFIG["verbose"]:
+                print(f"  [{i+1}/{len(text)}] '{char}' 입력, 딜레이: {actual_delay:.3f}초")
             time.sleep(actual_delay)
         
         print(f"[타이핑 완료] '{text}'")
@@ -975,9 +982,20 @@ class CDP:
         print("[입력] Enter 키 입력")
     
     def navigate(self, url, wait=3):
-        """페이지 이동"""
+        """페이지 이동 (새 문서 DOM이 준비되면 바로 진행, wait는 최대 대기 시간)"""
+        # 이전 문서에 표시를 남겨 두고, 표시가 없는 문서 = 새로 로드된 문서
+        self.send("Runtime.evaluate", {"expression": "window.__navPending = true"})
         self.send("Page.navigate", {"url": url})
-        time.sleep(wait)  # 페이지 로딩 대기
+        
+        deadline = time.time() + wait
+        while time.time() < deadline:
+            result = self.send("Runtime.evaluate", {
+                "expression": "!window.__navPending && document.readyState !== 'loading'",
+                "returnByValue": True
+            })
+            if result.get("result", {}).get("value"):
+                break
+            time.sleep(0.1)
         print(f"[이동] {url}")
     
     def close(self):
@@ -3530,6 +3548,53 @@ def get_element_bounds(cdp, selector=None, text=None):
     return result.get("result", {}).get("value", {"found": False})
 
 
+@lru_cache(maxsize=32)
+def first_element_js(selectors):
+    """get_first_element_bounds용 JS (selector 튜플별로 한 번만 생성)"""
+    return f"""
+    (function() {{
+        const selectors = {json.dumps(list(selectors))};
+        for (let i = 0; i < selectors.length; i++) {{
+            let el = null;
+            try {{ el = document.querySelector(selectors[i]); }} catch (e) {{}}
+            if (!el) continue;
+            const rect = el.getBoundingClientRect();
+            if (rect.height > 0) return {{
+                found: true,
+                index: i,
+                x: rect.left,
+                y: rect.top,
+                width: rect.width,
+                height: rect.height,
+                centerX: rect.left + rect.width / 2,
+                centerY: rect.top + rect.height / 2
+            }};
+        }}
+        return {{ found: false }};
+    }})()
+    """
+
+
+def get_first_element_bounds(cdp, selectors):
+    """
+    selector 리스트 중 처음 찾은 요소의 위치 (evaluate 한 번으로 전부 확인)
+    
+    Args:
+        selectors: selector 리스트 (우선순위대로)
+    
+    Returns:
+        {found: bool, index: 찾은 selector 순번, x, y, width, height, centerX, centerY}
+    """
+    js_code = first_element_js(tuple(selectors))
+    
+    result = cdp.send("Runtime.evaluate", {
+        "expression": js_code,
+        "returnByValue": True
+    })
+    
+    return result.get("result", {}).get("value", {"found": False})
+
+
 def wait_for_element(cdp, selectors, timeout=None, interval=None, after_delay=True):
     """
     요소가 나타날 때까지 대기
@@ -3551,19 +3616,19 @@ def wait_for_element(cdp, selectors, timeout=None, interval=None, after_delay=Tr
     start_time = time.time()
     
     while time.time() - start_time < timeout:
-        for selector in selectors:
-            bounds = get_element_bounds(cdp, selector=selector)
-            if bounds.get("found") and bounds.get("height", 0) > 0:
-                print(f"[대기 완료] 요소 발견: {selector} ({time.time() - start_time:.1f}초)")
-                
-                # 요소 발견 후 추가 딜레이
-                if after_delay:
-                    delay = wait_config["after_found_delay"]
-                    delay_random = wait_config["after_found_delay_random"]
-                    sleep_time = delay + random.uniform(0, delay_random)
-                    time.sleep(sleep_time)
-                
-                return {"found": True, "selector": selector, "bounds": bounds}
+        bounds = get_first_element_bounds(cdp, selectors)
+        if bounds.get("found"):
+            selector = selectors[bounds["index"]]
+            print(f"[대기 완료] 요소 발견: {selector} ({time.time() - start_time:.1f}초)")
+            
+            # 요소 발견 후 추가 딜레이
+            if after_delay:
+                delay = wait_config["after_found_delay"]
+                delay_random = wait_config["after_found_delay_random"]
+                sleep_time = delay + random.uniform(0, delay_random)
+                time.sleep(sleep_time)
+            
+            return {"found": True, "selector": selector, "bounds": bounds}
         
         time.sleep(interval)
     
@@ -3589,6 +3654,8 @@ def wait_for_element_with_retry(cdp, selectors, timeout=None, interval=None, aft
     """
     max_retry = CONFIG["retry"]["max_element_retry"]  # 30
     max_full_retry = CONFIG["retry"]["max_full_retry"]  # 2
+    max_wait = CONFIG["retry"]["max_element_wait"]
+    deadline = time.time() + max_wait
     
     for full_round in range(max_full_retry):
         if full_round > 0:
@@ -3597,13 +3664,19 @@ def wait_for_element_with_retry(cdp, selectors, timeout=None, interval=None, aft
             time.sleep(CONFIG["retry"]["after_refresh_delay"])
         
         for retry_count in range(1, max_retry + 1):
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                print(f"[오류] 요소 대기 전체 시간 초과 ({max_wait}초)")
+                return {"found": False, "selector": None, "bounds": None, "error": True}
+            
             # 페이지 오류 체크
             if check_page_error(cdp):
                 print(f"[오류] 페이지 오류 감지!")
                 return {"found": False, "selector": None, "bounds": None, "error": True}
             
             # 요소 대기
-            result = wait_for_element(cdp, selectors, timeout=timeout, interval=interval, after_delay=after_delay)
+            wait_timeout = min(timeout or CONFIG["wait"]["timeout"], remaining)
+            result = wait_for_element(cdp, selectors, timeout=wait_timeout, interval=interval, after_delay=after_delay)
             
             if result["found"]:
                 return {"found": True, "selector": result["selector"], "bounds": result["bounds"], "error": False}
@@ -3971,6 +4044,16 @@ def is_page_loaded(cdp):
     return state == "complete"
 
 
+def get_url_and_ready_state(cdp):
+    """현재 URL + document.readyState를 evaluate 한 번으로 가져오기"""
+    result = cdp.send("Runtime.evaluate", {
+        "expression": "[window.location.href, document.readyState]",
+        "returnByValue": True
+    })
+    value = result.get("result", {}).get("value") or ["", ""]
+    return value[0], value[1]
+
+
 def wait_for_page_load(cdp, before_url, timeout=120, check_interval=0.5):
     """
     페이지 로딩 완료 대기
@@ -3993,14 +4076,14 @@ def wait_for_page_load(cdp, before_url, timeout=120, check_interval=0.5):
     print(f"[페이지 로딩 대기] 최대 {timeout}초...")
     
     while time.time() - start_time < timeout:
-        current_url = get_current_url(cdp)
+        current_url, ready_state = get_url_and_ready_state(cdp)
         
         # URL 변경 확인
         if current_url != before_url:
             url_changed = True
             
             # URL 변경 후 로딩 완료 확인
-            if is_page_loaded(cdp):
+            if ready_state == "complete":
                 elapsed = time.time() - start_time
                 print(f"[페이지 로딩 완료] {elapsed:.1f}초 소요")
                 